@@ -8,8 +8,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Tuple, Callable, List
 from ..services.config_service import ConfigService
-from ..services.ssh_service import SSHService
-from ..services.sftp_service import SFTPService
+from ..services.sftp_service import SFTPPool
 from ..services.database_service import DatabaseService
 from ..utils.logger import setup_logger
 
@@ -17,9 +16,10 @@ from ..utils.logger import setup_logger
 class DBPullController:
     """Handles database pull operations from remote to local"""
 
-    def __init__(self, config_service: ConfigService):
+    def __init__(self, config_service: ConfigService, sftp_pool: SFTPPool = None):
         self.config_service = config_service
         self.logger = setup_logger('db_pull')
+        self._sftp_pool = sftp_pool or SFTPPool()
 
     def _save_database_backup(self, source_file: str, db_name: str, backup_type: str, local_root: str) -> str:
         """
@@ -92,6 +92,7 @@ class DBPullController:
 
         temp_local_file = None
         temp_remote_file = None
+        sftp = None
 
         try:
             # Calculate total steps
@@ -105,8 +106,7 @@ class DBPullController:
             if progress_callback:
                 progress_callback(current_step, total_steps, "Verifying WP-CLI locally")
 
-            ssh_service = SSHService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-            db_service = DatabaseService(site, ssh_service)
+            db_service = DatabaseService(site)
 
             success, version = db_service.verify_wp_cli_local()
             if not success:
@@ -117,7 +117,10 @@ class DBPullController:
             if progress_callback:
                 progress_callback(current_step, total_steps, "Connecting to remote server")
 
-            ssh_service.connect()
+            # Run commands and transfers over the pooled connection instead of a new handshake
+            sftp = self._sftp_pool.acquire(site, ssh_password)
+            ssh_service = sftp.open_ssh()
+            db_service.ssh_service = ssh_service
 
             # Step 3: Verify WP-CLI remotely
             current_step += 1
@@ -177,10 +180,7 @@ class DBPullController:
 
             temp_local_file = os.path.join(tempfile.gettempdir(), f"db-pull-{site_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.sql")
 
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-            sftp.connect()
             success, msg = sftp.download_file(temp_remote_file_replaced, temp_local_file)
-            sftp.disconnect()
 
             if not success:
                 ssh_service.disconnect()
@@ -310,6 +310,10 @@ class DBPullController:
             return False, error_msg, stats
 
         finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
             # Cleanup local temp file
             if temp_local_file and os.path.exists(temp_local_file):
                 try:
@@ -347,16 +351,15 @@ class DBPullController:
             ssh_password = self.config_service.get_password(site_id)
             if ssh_password:
                 try:
-                    # Connect and get table list
-                    ssh_service = SSHService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-                    ssh_service.connect()
-
-                    db_service = DatabaseService(site, ssh_service)
-                    success, tables = db_service.get_remote_table_list()
-                    if success:
-                        preview['remote_tables'] = tables
-
-                    ssh_service.disconnect()
+                    # Get the table list over the pooled connection
+                    sftp = self._sftp_pool.acquire(site, ssh_password)
+                    try:
+                        db_service = DatabaseService(site, sftp.open_ssh())
+                        success, tables = db_service.get_remote_table_list()
+                        if success:
+                            preview['remote_tables'] = tables
+                    finally:
+                        self._sftp_pool.release(site_id, sftp)
                 except:
                     pass
 
@@ -8,8 +8,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Tuple, Callable, List
 from ..services.config_service import ConfigService
-from ..services.ssh_service import SSHService
-from ..services.sftp_service import SFTPService
+from ..services.sftp_service import SFTPPool
 from ..services.database_service import DatabaseService
 from ..utils.logger import setup_logger
 
@@ -17,9 +16,10 @@ from ..utils.logger import setup_logger
 class DBPushController:
     """Handles database push operations from local to remote"""
 
-    def __init__(self, config_service: ConfigService):
+    def __init__(self, config_service: ConfigService, sftp_pool: SFTPPool = None):
         self.config_service = config_service
         self.logger = setup_logger('db_push')
+        self._sftp_pool = sftp_pool or SFTPPool()
 
     def _save_database_backup(self, source_file: str, db_name: str, backup_type: str, local_root: str) -> str:
         """
@@ -92,6 +92,7 @@ class DBPushController:
 
         temp_local_file = None
         temp_remote_file = None
+        sftp = None
 
         try:
             # Calculate total steps
@@ -105,8 +106,7 @@ class DBPushController:
             if progress_callback:
                 progress_callback(current_step, total_steps, "Verifying WP-CLI locally")
 
-            ssh_service = SSHService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-            db_service = DatabaseService(site, ssh_service)
+            db_service = DatabaseService(site)
 
             success, version = db_service.verify_wp_cli_local()
             if not success:
@@ -117,7 +117,10 @@ class DBPushController:
             if progress_callback:
                 progress_callback(current_step, total_steps, "Connecting to remote server")
 
-            ssh_service.connect()
+            # Run commands and transfers over the pooled connection instead of a new handshake
+            sftp = self._sftp_pool.acquire(site, ssh_password)
+            ssh_service = sftp.open_ssh()
+            db_service.ssh_service = ssh_service
 
             # Step 3: Verify WP-CLI remotely
             current_step += 1
@@ -203,10 +206,7 @@ class DBPushController:
 
             temp_remote_file = f"/tmp/db-push-{site_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.sql"
 
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-            sftp.connect()
             success, msg = sftp.upload_file(temp_local_file, temp_remote_file)
-            sftp.disconnect()
 
             if not success:
                 ssh_service.disconnect()
@@ -231,10 +231,7 @@ class DBPushController:
                             remote_backup_path = os.path.join(site.remote_path, backup_file)
                             temp_remote_backup = os.path.join(tempfile.gettempdir(), f"remote-backup-{timestamp}.sql")
 
-                            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, ssh_password)
-                            sftp.connect()
                             sftp.download_file(remote_backup_path, temp_remote_backup)
-                            sftp.disconnect()
 
                             self._save_database_backup(
                                 temp_remote_backup,
@@ -317,6 +314,10 @@ class DBPushController:
             return False, error_msg, stats
 
         finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
             # Cleanup local temp file
             if temp_local_file and os.path.exists(temp_local_file):
                 try:
@@ -2,25 +2,30 @@
 Pull controller for downloading files from remote server
 """
 import os
-import zipfile
-import tempfile
+import subprocess
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Callable, Tuple
-from ..services.sftp_service import SFTPService
+from typing import List, Callable, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ..services.sftp_service import SFTPPool
 from ..services.ssh_service import SSHService
 from ..services.config_service import ConfigService
 from ..models.sync_state import OperationState
 from ..utils.patterns import filter_files
+from ..utils.compression import (PARALLEL_COMPRESSORS, choose_compressor, local_compressors,
+                                 tar_create_commands, tar_extract_commands, shell_pipeline,
+                                 start_pipeline, wait_pipeline)
 from ..utils.logger import setup_logger
 
 
 class PullController:
     """Handles pull operations from remote to local"""
 
-    def __init__(self, config_service: ConfigService):
+    def __init__(self, config_service: ConfigService, sftp_pool: SFTPPool = None):
         self.config_service = config_service
         self.logger = setup_logger('pull')
+        self._sftp_pool = sftp_pool or SFTPPool()
 
     def pull(self, site_id: str, start_date: datetime, end_date: datetime,
              include_paths: List[str] = None, progress_callback: Callable = None) -> Tuple[bool, str, dict]:
@@ -64,10 +69,10 @@ class PullController:
             'files': []
         }
 
+        sftp = None
         try:
             # Connect to SFTP
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
+            sftp = self._sftp_pool.acquire(site, password)
 
             # Collect all files from include paths
             all_files = []
@@ -88,7 +93,6 @@ class PullController:
                 all_files.extend(files)
 
             if not all_files:
-                sftp.disconnect()
                 self.logger.info("No files found matching criteria")
                 return True, "No files found matching criteria", stats
 
@@ -101,41 +105,39 @@ class PullController:
 
             self.logger.info(f"Found {len(files_to_pull)} files to pull")
 
-            # Download files
-            total_files = len(files_to_pull)
-            files_skipped = 0
-            for i, (remote_file, mod_date) in enumerate(files_to_pull):
-                if progress_callback:
-                    # Get relative path for display
-                    rel_path = remote_file.replace(site.remote_path, '').lstrip('/')
-                    progress_callback(i + 1, total_files, f"Downloading {rel_path}")
-
-                # Calculate local path
+            # Download files, several at a time over the same connection
+            def download(channel, entry):
+                remote_file = entry[0]
                 # Remove remote_path prefix to get relative path
                 rel_path = remote_file.replace(site.remote_path, '').lstrip('/')
                 local_file = os.path.join(site.local_path, rel_path)
 
                 # Skip if push_newer_only is enabled and remote file is not newer
-                if site.push_newer_only:
-                    if not sftp.is_remote_newer(remote_file, local_file):
-                        self.logger.info(f"Skipping {rel_path} (local is up-to-date)")
-                        files_skipped += 1
-                        continue
-
-                # Download file
-                success, message = sftp.download_file(remote_file, local_file)
+                if site.push_newer_only and not channel.is_remote_newer(remote_file, local_file):
+                    return rel_path, 'skipped', None
 
+                success, message = channel.download_file(remote_file, local_file)
                 if success:
+                    return rel_path, 'downloaded', os.path.getsize(local_file)
+                return rel_path, 'failed', message
+
+            total_files = len(files_to_pull)
+            files_skipped = 0
+            results = sftp.transfer_parallel(files_to_pull, download, site.transfer_workers)
+            for i, ((remote_file, _), (rel_path, outcome, detail)) in enumerate(results, 1):
+                if outcome == 'downloaded':
                     stats['files_pulled'] += 1
-                    file_size = os.path.getsize(local_file)
-                    stats['bytes_transferred'] += file_size
+                    stats['bytes_transferred'] += detail
                     stats['files'].append(rel_path)
+                elif outcome == 'skipped':
+                    self.logger.info(f"Skipping {rel_path} (local is up-to-date)")
+                    files_skipped += 1
                 else:
                     stats['files_failed'] += 1
-                    self.logger.error(f"Failed to download {remote_file}: {message}")
+                    self.logger.error(f"Failed to download {remote_file}: {detail}")
 
-            # Disconnect SFTP
-            sftp.disconnect()
+                if progress_callback:
+                    progress_callback(i, total_files, f"Processed {rel_path}")
 
             # Update sync state
             operation_state = OperationState(
@@ -164,6 +166,11 @@ class PullController:
             self.logger.error(error_msg)
             return False, error_msg, stats
 
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
     def get_files_to_pull(self, site_id: str, start_date: datetime, end_date: datetime,
                           include_paths: List[str] = None) -> Tuple[bool, str, List[Tuple[str, datetime]]]:
         """
@@ -178,6 +185,7 @@ class PullController:
         Returns:
             Tuple of (success, message, files_list)
         """
+        sftp = None
         try:
             site = self.config_service.get_site(site_id)
             if not site:
@@ -194,8 +202,7 @@ class PullController:
                 return False, "No include paths specified", []
 
             # Connect to SFTP
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
+            sftp = self._sftp_pool.acquire(site, password)
 
             # Collect all files
             all_files = []
@@ -212,8 +219,6 @@ class PullController:
                 files = sftp.list_files_recursive(remote_path, start_date, end_date)
                 all_files.extend(files)
 
-            sftp.disconnect()
-
             # Filter files
             file_paths = [f[0] for f in all_files]
             filtered_paths = filter_files(file_paths, site.exclude_patterns)
@@ -224,14 +229,72 @@ class PullController:
         except Exception as e:
             return False, str(e), []
 
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
+    def _pull_folder(self, ssh: SSHService, site, folder: str, compressor: str,
+                     local: Set[str], report: Callable) -> Tuple[bool, int, str]:
+        """
+        Stream one folder as a tarball from tar on the remote straight into a local tar
+
+        Compression, transfer and extraction overlap and nothing touches disk.
+        Existing local files are overwritten.
+
+        Args:
+            ssh: SSHService on the site's connection
+            site: Site configuration
+            folder: Folder path relative to remote_path
+            compressor: Result of choose_compressor
+            local: Parallel compressors available on this machine
+            report: Callable(message) for progress messages
+
+        Returns:
+            Tuple of (success, bytes_received, error)
+        """
+        remote_folder = os.path.join(site.remote_path, folder).replace('\\', '/')
+
+        # Count files on remote (estimate)
+        report(f"Counting files in {folder}...")
+        count_command = f"find {remote_folder} -type f | wc -l"
+        success, output, error = ssh.execute_command(count_command)
+        file_count = int(output.strip()) if success and output.strip().isdigit() else 0
+        report(f"Streaming {folder} with {compressor} ({file_count} files)")
+
+        def report_received(bytes_received):
+            report(f"Streaming {folder} with {compressor} "
+                   f"({bytes_received / (1024 * 1024):.1f} MB received)")
+
+        # Archive paths relative to remote_path to maintain structure
+        compress_command = shell_pipeline(tar_create_commands(compressor, site.remote_path, [folder]))
+        # Extract to local_path, which will overwrite existing files
+        pipeline = start_pipeline(tar_extract_commands(compressor, site.local_path, local),
+                                  stdin=subprocess.PIPE)
+        try:
+            success, bytes_received, error = ssh.stream_from_command(compress_command, pipeline[0].stdin,
+                                                                     report_received)
+        finally:
+            pipeline[0].stdin.close()
+            tar_status = wait_pipeline(pipeline)
+
+        if not success:
+            return False, bytes_received, error
+        if tar_status != 0:
+            return False, bytes_received, f"local tar exited with status {tar_status}"
+        return True, bytes_received, ''
+
     def pull_folders(self, site_id: str, folders: List[str], progress_callback: Callable = None) -> Tuple[bool, str, dict]:
         """
-        Pull specific folders by compressing on remote, transferring, and extracting locally
+        Pull specific folders by streaming a tarball from tar on the remote
+
+        Folders are streamed concurrently (up to the site's transfer_workers), each
+        on its own session of the pooled connection.
 
         Args:
             site_id: Site identifier
             folders: List of folder paths relative to remote_path
-            progress_callback: Optional callback(current, total, message)
+            progress_callback: Optional callback(folders_done, total, message)
 
         Returns:
             Tuple of (success, message, stats_dict)
@@ -255,24 +318,31 @@ class PullController:
             'folders': []
         }
 
+        sftp = None
         try:
-            # Connect to SFTP and SSH
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
+            # Connect to SFTP; remote commands run over the same connection
+            sftp = self._sftp_pool.acquire(site, password)
+            ssh = sftp.open_ssh()
 
-            ssh = SSHService(site.remote_host, site.remote_port, site.remote_username, password)
-            ssh.connect()
+            # Use a multi-threaded compressor when both ends have one
+            local = local_compressors()
+            compressor = choose_compressor(ssh.find_programs(PARALLEL_COMPRESSORS), local)
+            self.logger.info(f"Compressing folders with {compressor}")
 
+            # Progress is (folders done, total, message); workers report concurrently
+            folders = [folder.strip() for folder in folders if folder.strip()]
             total_folders = len(folders)
+            done = 0
+            lock = threading.Lock()
 
-            for i, folder in enumerate(folders):
-                folder = folder.strip()
-                if not folder:
-                    continue
-
+            def report(message):
                 if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Processing {folder}")
+                    with lock:
+                        progress_callback(done, total_folders, message)
 
+            # Check every folder first, then stream the valid ones side by side
+            folders_to_pull = []
+            for folder in folders:
                 # Ensure folder path doesn't start with /
                 if folder.startswith('/'):
                     folder = folder[1:]
@@ -283,103 +353,37 @@ class PullController:
                 if not sftp.path_exists(remote_folder):
                     self.logger.warning(f"Remote folder not found: {remote_folder}")
                     stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Folder not found: {folder}")
-                    continue
-
-                # Count files on remote (estimate)
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Counting files in {folder}...")
-
-                count_command = f"find {remote_folder} -type f | wc -l"
-                success, output, error = ssh.execute_command(count_command)
-                file_count = int(output.strip()) if success and output.strip().isdigit() else 0
-
-                # Create zip file on remote
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Compressing {folder} on remote ({file_count} files)")
-
-                timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                zip_filename = f"pull-folder-{site_id}-{i}-{timestamp}.zip"
-                remote_zip_path = f"/tmp/{zip_filename}"
-
-                # Compress folder on remote
-                # Change to remote_path directory and zip relative paths to maintain structure
-                compress_command = f"cd {site.remote_path} && zip -r {remote_zip_path} {folder}"
-                success, output, error = ssh.execute_command(compress_command)
-
-                if not success:
-                    self.logger.error(f"Failed to compress {folder}: {error}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Compression failed: {folder}")
+                    done += 1
+                    report(f"❌ Folder not found: {folder}")
                     continue
 
-                # Get zip file size
-                size_command = f"stat -f%z {remote_zip_path} 2>/dev/null || stat -c%s {remote_zip_path} 2>/dev/null"
-                success, output, error = ssh.execute_command(size_command)
-                zip_size = int(output.strip()) if success and output.strip().isdigit() else 0
-                zip_size_mb = zip_size / (1024 * 1024) if zip_size > 0 else 0
-
-                # Download zip file
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Downloading {folder} ({zip_size_mb:.1f} MB)")
-
-                local_zip_path = os.path.join(tempfile.gettempdir(), zip_filename)
-                success, message = sftp.download_file(remote_zip_path, local_zip_path)
-
-                if not success:
-                    self.logger.error(f"Failed to download zip for {folder}: {message}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Download failed: {folder}")
-                    # Clean up remote zip
-                    ssh.execute_command(f"rm -f {remote_zip_path}")
-                    continue
-
-                stats['bytes_transferred'] += zip_size if zip_size > 0 else os.path.getsize(local_zip_path)
-
-                # Extract locally
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Extracting {folder} locally...")
-
-                try:
-                    with zipfile.ZipFile(local_zip_path, 'r') as zipf:
-                        # Extract to local_path, which will overwrite existing files
-                        zipf.extractall(site.local_path)
-
-                    self.logger.info(f"Successfully extracted {folder} to {site.local_path}")
-
-                except Exception as e:
-                    self.logger.error(f"Failed to extract {folder}: {e}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Extraction failed: {folder}")
-                    # Clean up
-                    ssh.execute_command(f"rm -f {remote_zip_path}")
-                    if os.path.exists(local_zip_path):
-                        os.remove(local_zip_path)
-                    continue
-
-                # Clean up remote zip file
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Cleaning up {folder}...")
-                ssh.execute_command(f"rm -f {remote_zip_path}")
-
-                # Clean up local temp file
-                if os.path.exists(local_zip_path):
-                    os.remove(local_zip_path)
-
-                stats['folders_pulled'] += 1
-                stats['folders'].append(folder)
-                self.logger.info(f"Successfully pulled folder: {folder}")
-
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"✓ Completed {folder}")
+                folders_to_pull.append(folder)
+
+            os.makedirs(site.local_path, exist_ok=True)
+
+            # Each folder streams on its own session of the shared connection
+            workers = max(1, min(site.transfer_workers, len(folders_to_pull)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._pull_folder, ssh, site, folder, compressor, local,
+                                       report): folder
+                           for folder in folders_to_pull}
+                for future in as_completed(futures):
+                    folder = futures[future]
+                    success, bytes_received, error = future.result()
+                    stats['bytes_transferred'] += bytes_received
+                    with lock:
+                        done += 1
+
+                    if not success:
+                        self.logger.error(f"Failed to pull {folder}: {error}")
+                        stats['folders_failed'] += 1
+                        report(f"❌ Transfer failed: {folder}")
+                        continue
 
-            # Disconnect
-            sftp.disconnect()
-            ssh.disconnect()
+                    stats['folders_pulled'] += 1
+                    stats['folders'].append(folder)
+                    self.logger.info(f"Successfully pulled folder: {folder}")
+                    report(f"✓ Completed {folder}")
 
             if stats['folders_pulled'] == 0 and stats['folders_failed'] > 0:
                 return False, f"All folders failed to pull", stats
@@ -395,3 +399,8 @@ class PullController:
             error_msg = f"Pull folders failed: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg, stats
+
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
@@ -2,27 +2,40 @@
 Push controller for uploading files to remote server
 """
 import os
+import gzip
+import subprocess
+import tarfile
+import threading
 import zipfile
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import List, Callable, Tuple, Dict
+from typing import List, Callable, Tuple, Dict, Set
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..services.git_service import GitService
-from ..services.sftp_service import SFTPService
-from ..services.ssh_service import SSHService
+from ..services.sftp_service import SFTPService, SFTPPool
+from ..services.ssh_service import SSHService, RemoteStat
 from ..services.config_service import ConfigService
+from ..services.push_cache import PushCache
 from ..models.sync_state import OperationState
 from ..utils.patterns import filter_files
+from ..utils.compression import (PARALLEL_COMPRESSORS, choose_compressor, local_compressors,
+                                 tar_create_commands, tar_extract_commands, shell_pipeline,
+                                 start_pipeline, wait_pipeline)
 from ..utils.logger import setup_logger
 
+# gzip level for file lists streamed as one tarball (9 costs much more CPU for little gain)
+STREAM_COMPRESS_LEVEL = 6
+
 
 class PushController:
     """Handles push operations from local to remote"""
 
-    def __init__(self, config_service: ConfigService):
+    def __init__(self, config_service: ConfigService, sftp_pool: SFTPPool = None):
         self.config_service = config_service
         self.logger = setup_logger('push')
+        self._sftp_pool = sftp_pool or SFTPPool()
 
     def _group_files_by_folder(self, files: List[str], threshold: int = 5) -> Dict[str, List[str]]:
         """
@@ -113,6 +126,145 @@ class PushController:
         except Exception as e:
             return False, str(e)
 
+    def _upload_files(self, sftp: SFTPService, site, files: List[str], stats: dict,
+                      progress_callback: Callable = None):
+        """
+        Upload files relative to the site root, several at a time
+
+        Args:
+            sftp: Connected SFTP service (extra sessions are opened on its transport)
+            site: Site configuration
+            files: File paths relative to local_path/remote_path
+            stats: Stats dict to update (files_pushed, files_failed, bytes_transferred, files)
+            progress_callback: Optional callback(current, total, message)
+        """
+        def upload(channel, file_path):
+            local_file = os.path.join(site.local_path, file_path)
+            remote_file = os.path.join(site.remote_path, file_path).replace('\\', '/')
+
+            # Check if local file exists
+            if not os.path.exists(local_file):
+                return 'missing', local_file
+
+            success, message = channel.upload_file(local_file, remote_file)
+            if success:
+                return 'uploaded', os.path.getsize(local_file)
+            return 'failed', message
+
+        total_files = len(files)
+        results = sftp.transfer_parallel(files, upload, site.transfer_workers)
+        for i, (file_path, (outcome, detail)) in enumerate(results, 1):
+            if outcome == 'uploaded':
+                stats['files_pushed'] += 1
+                stats['bytes_transferred'] += detail
+                stats['files'].append(file_path)
+            elif outcome == 'missing':
+                self.logger.warning(f"Local file not found, skipping: {detail}")
+            else:
+                stats['files_failed'] += 1
+                self.logger.error(f"Failed to upload {file_path}: {detail}")
+
+            if progress_callback:
+                progress_callback(i, total_files, f"Processed {file_path}")
+
+    def _select_files(self, ssh: SSHService, site, files: List[str], newer_only: bool,
+                      cache: PushCache = None) -> Tuple[List[str], int]:
+        """
+        Drop files the remote already has up to date, judged from one remote listing
+
+        Args:
+            ssh: SSHService on the site's connection
+            site: Site configuration
+            files: File paths relative to local_path/remote_path
+            newer_only: Skip files whose remote copy is not older
+            cache: Optional PushCache; files unchanged since they were last pushed are skipped
+
+        Returns:
+            Tuple of (files still to push, number of files skipped)
+        """
+        if not newer_only and cache is None:
+            return files, 0
+
+        remote_files = ssh.stat_files(site.remote_path, files)
+        selected = []
+        for file_path in files:
+            local_file = os.path.join(site.local_path, file_path)
+            remote = remote_files.get(file_path)
+
+            # Missing local files are reported when the stream is built
+            if remote is not None and os.path.isfile(local_file):
+                # Skip if nothing changed on either side since the last push
+                if cache is not None and cache.is_unchanged(file_path, local_file, remote):
+                    self.logger.info(f"Skipping {file_path} (unchanged since last push)")
+                    continue
+
+                # Skip if the local file is not newer (whole seconds: a pushed copy
+                # gets the local mtime from tar, give or take float rounding)
+                if newer_only and int(os.path.getmtime(local_file)) <= int(remote.st_mtime):
+                    self.logger.info(f"Skipping {file_path} (remote is up-to-date)")
+                    continue
+
+            selected.append(file_path)
+
+        return selected, len(files) - len(selected)
+
+    def _stream_files(self, ssh: SSHService, site, files: List[str], stats: dict,
+                      progress_callback: Callable = None, cache: PushCache = None) -> Tuple[bool, str]:
+        """
+        Upload files relative to the site root as one gzipped tar stream extracted on the remote
+
+        One session carries every file, so there is no per-file round-trip, and
+        the tarball is written straight to the channel without touching disk.
+
+        Args:
+            ssh: SSHService on the site's connection
+            site: Site configuration
+            files: File paths relative to local_path/remote_path
+            stats: Stats dict to update (files_pushed, files_failed, bytes_transferred, files)
+            progress_callback: Optional callback(current, total, message)
+            cache: Optional PushCache the pushed files are recorded in
+
+        Returns:
+            Tuple of (success, error output)
+        """
+        if not files:
+            return True, ''
+
+        total_files = len(files)
+        added = []
+
+        def write(stdin):
+            with gzip.GzipFile(fileobj=stdin, mode='wb', compresslevel=STREAM_COMPRESS_LEVEL) as gz, \
+                    tarfile.open(fileobj=gz, mode='w|', dereference=True) as tar:
+                for i, file_path in enumerate(files, 1):
+                    local_file = os.path.join(site.local_path, file_path)
+                    if os.path.isfile(local_file):
+                        st = os.stat(local_file)
+                        tar.add(local_file, arcname=file_path, recursive=False)
+                        added.append((file_path, st))
+                    else:
+                        self.logger.warning(f"Local file not found, skipping: {local_file}")
+
+                    if progress_callback:
+                        progress_callback(i, total_files, f"Packed {file_path}")
+
+        extract_command = shell_pipeline(tar_extract_commands('gzip', site.remote_path, set()))
+        success, output = ssh.write_to_command(extract_command, write)
+
+        if not success:
+            stats['files_failed'] += len(added)
+            return False, output
+
+        for file_path, st in added:
+            stats['files_pushed'] += 1
+            stats['bytes_transferred'] += st.st_size
+            stats['files'].append(file_path)
+            if cache is not None:
+                # tar gives the remote copy the local mtime
+                cache.record(file_path, os.path.join(site.local_path, file_path),
+                             RemoteStat(st.st_mtime, st.st_size))
+        return True, output
+
     def push(self, site_id: str, progress_callback: Callable = None) -> Tuple[bool, str, dict]:
         """
         Push files from local to remote
@@ -143,6 +295,7 @@ class PushController:
             'files': []
         }
 
+        sftp = None
         try:
             # Initialize Git service
             git_service = GitService(site.git_repo_path)
@@ -166,46 +319,18 @@ class PushController:
 
             self.logger.info(f"Found {len(files_to_push)} files to push")
 
-            # Connect to SFTP
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
-
-            # Upload files
-            total_files = len(files_to_push)
-            files_skipped = 0
-            for i, file_path in enumerate(files_to_push):
-                if progress_callback:
-                    progress_callback(i + 1, total_files, f"Uploading {file_path}")
-
-                local_file = os.path.join(site.local_path, file_path)
-                remote_file = os.path.join(site.remote_path, file_path).replace('\\', '/')
-
-                # Check if local file exists
-                if not os.path.exists(local_file):
-                    self.logger.warning(f"Local file not found, skipping: {local_file}")
-                    continue
+            # Connect to SFTP; remote commands run over the same connection
+            sftp = self._sftp_pool.acquire(site, password)
+            ssh = sftp.open_ssh()
 
-                # Skip if push_newer_only is enabled and local file is not newer
-                if site.push_newer_only:
-                    if not sftp.is_local_newer(local_file, remote_file):
-                        self.logger.info(f"Skipping {file_path} (remote is up-to-date)")
-                        files_skipped += 1
-                        continue
-
-                # Upload file
-                success, message = sftp.upload_file(local_file, remote_file)
-
-                if success:
-                    stats['files_pushed'] += 1
-                    file_size = os.path.getsize(local_file)
-                    stats['bytes_transferred'] += file_size
-                    stats['files'].append(file_path)
-                else:
-                    stats['files_failed'] += 1
-                    self.logger.error(f"Failed to upload {file_path}: {message}")
-
-            # Disconnect SFTP
-            sftp.disconnect()
+            # Skip files the remote already has, then send the rest as a single tar stream
+            files_to_push, files_skipped = self._select_files(ssh, site, files_to_push,
+                                                              site.push_newer_only)
+            success, output = self._stream_files(ssh, site, files_to_push, stats, progress_callback)
+            if not success:
+                error_msg = f"Push failed: {output}"
+                self.logger.error(error_msg)
+                return False, error_msg, stats
 
             # Update last pushed commit
             self.config_service.update_last_pushed_commit(site_id, current_commit)
@@ -237,6 +362,11 @@ class PushController:
             self.logger.error(error_msg)
             return False, error_msg, stats
 
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
     def push_all(self, site_id: str, progress_callback: Callable = None) -> Tuple[bool, str, dict]:
         """
         Push ALL files from git repo to remote (ignores last_pushed_commit)
@@ -267,6 +397,7 @@ class PushController:
             'files': []
         }
 
+        sftp = None
         try:
             # Initialize Git service
             git_service = GitService(site.git_repo_path)
@@ -286,46 +417,23 @@ class PushController:
 
             self.logger.info(f"Found {len(files_to_push)} files to push")
 
-            # Connect to SFTP
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
-
-            # Upload files
-            total_files = len(files_to_push)
-            files_skipped = 0
-            for i, file_path in enumerate(files_to_push):
-                if progress_callback:
-                    progress_callback(i + 1, total_files, f"Uploading {file_path}")
-
-                local_file = os.path.join(site.local_path, file_path)
-                remote_file = os.path.join(site.remote_path, file_path).replace('\\', '/')
-
-                # Check if local file exists
-                if not os.path.exists(local_file):
-                    self.logger.warning(f"Local file not found, skipping: {local_file}")
-                    continue
-
-                # Skip if push_newer_only is enabled and local file is not newer
-                if site.push_newer_only:
-                    if not sftp.is_local_newer(local_file, remote_file):
-                        self.logger.info(f"Skipping {file_path} (remote is up-to-date)")
-                        files_skipped += 1
-                        continue
-
-                # Upload file
-                success, message = sftp.upload_file(local_file, remote_file)
-
-                if success:
-                    stats['files_pushed'] += 1
-                    file_size = os.path.getsize(local_file)
-                    stats['bytes_transferred'] += file_size
-                    stats['files'].append(file_path)
-                else:
-                    stats['files_failed'] += 1
-                    self.logger.error(f"Failed to upload {file_path}: {message}")
-
-            # Disconnect SFTP
-            sftp.disconnect()
+            # Connect to SFTP; remote commands run over the same connection
+            sftp = self._sftp_pool.acquire(site, password)
+            ssh = sftp.open_ssh()
+
+            # Skip files unchanged since the last push, then send the rest as a single tar stream
+            cache = PushCache(self.config_service.config_dir / 'push_cache' / f"{site_id}.json")
+            try:
+                files_to_push, files_skipped = self._select_files(ssh, site, files_to_push,
+                                                                  site.push_newer_only, cache)
+                success, output = self._stream_files(ssh, site, files_to_push, stats, progress_callback,
+                                                     cache)
+            finally:
+                cache.save()
+            if not success:
+                error_msg = f"Push ALL failed: {output}"
+                self.logger.error(error_msg)
+                return False, error_msg, stats
 
             # Update last pushed commit
             self.config_service.update_last_pushed_commit(site_id, current_commit)
@@ -357,6 +465,11 @@ class PushController:
             self.logger.error(error_msg)
             return False, error_msg, stats
 
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
     def push_from_commits(self, site_id: str, commit_hashes: List[str], progress_callback: Callable = None) -> Tuple[bool, str, dict]:
         """
         Push files that were changed in the specified commits
@@ -390,6 +503,7 @@ class PushController:
             'commits_pushed': len(commit_hashes)
         }
 
+        sftp = None
         try:
             # Initialize Git service
             git_service = GitService(site.git_repo_path)
@@ -407,37 +521,10 @@ class PushController:
             self.logger.info(f"Found {len(files_to_push)} unique files from {len(commit_hashes)} commits")
 
             # Connect to SFTP
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
+            sftp = self._sftp_pool.acquire(site, password)
 
             # Upload files
-            total_files = len(files_to_push)
-            for i, file_path in enumerate(files_to_push):
-                if progress_callback:
-                    progress_callback(i + 1, total_files, f"Uploading {file_path}")
-
-                local_file = os.path.join(site.local_path, file_path)
-                remote_file = os.path.join(site.remote_path, file_path).replace('\\', '/')
-
-                # Check if local file exists
-                if not os.path.exists(local_file):
-                    self.logger.warning(f"Local file not found, skipping: {local_file}")
-                    continue
-
-                # Upload file
-                success, message = sftp.upload_file(local_file, remote_file)
-
-                if success:
-                    stats['files_pushed'] += 1
-                    file_size = os.path.getsize(local_file)
-                    stats['bytes_transferred'] += file_size
-                    stats['files'].append(file_path)
-                else:
-                    stats['files_failed'] += 1
-                    self.logger.error(f"Failed to upload {file_path}: {message}")
-
-            # Disconnect SFTP
-            sftp.disconnect()
+            self._upload_files(sftp, site, files_to_push, stats, progress_callback)
 
             # Update sync state
             current_commit = git_service.get_current_commit()
@@ -467,6 +554,11 @@ class PushController:
             self.logger.error(error_msg)
             return False, error_msg, stats
 
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
+
     def get_files_to_push(self, site_id: str) -> Tuple[bool, str, List[str]]:
         """
         Get list of files that would be pushed (dry run)
@@ -497,14 +589,62 @@ class PushController:
         except Exception as e:
             return False, str(e), []
 
+    def _push_folder(self, ssh: SSHService, site, folder: str, compressor: str,
+                     remote_compressors: Set[str], report: Callable) -> Tuple[bool, int, str]:
+        """
+        Stream one folder as a tarball straight into tar on the remote
+
+        Compression, transfer and extraction overlap and nothing touches disk.
+        Existing remote files are overwritten.
+
+        Args:
+            ssh: SSHService on the site's connection
+            site: Site configuration
+            folder: Folder path relative to local_path
+            compressor: Result of choose_compressor
+            remote_compressors: Parallel compressors available on the remote
+            report: Callable(message) for progress messages
+
+        Returns:
+            Tuple of (success, bytes_sent, error)
+        """
+        local_folder = os.path.join(site.local_path, folder)
+        file_count = sum(len(files) for _, _, files in os.walk(local_folder))
+        report(f"Streaming {folder} with {compressor} ({file_count} files)")
+
+        def report_sent(bytes_sent):
+            report(f"Streaming {folder} with {compressor} ({bytes_sent / (1024 * 1024):.1f} MB sent)")
+
+        # Extract directly to remote_path, which will overwrite existing files
+        extract_command = shell_pipeline(tar_extract_commands(compressor, site.remote_path,
+                                                              remote_compressors))
+        pipeline = start_pipeline(tar_create_commands(compressor, site.local_path, [folder]),
+                                  stdout=subprocess.PIPE,
+                                  env=dict(os.environ, COPYFILE_DISABLE='1'))
+        try:
+            success, bytes_sent, output = ssh.stream_to_command(extract_command, pipeline[-1].stdout,
+                                                                report_sent)
+        finally:
+            pipeline[-1].stdout.close()
+            tar_status = wait_pipeline(pipeline)
+
+        if not success:
+            return False, bytes_sent, output
+        if tar_status != 0:
+            return False, bytes_sent, f"local tar exited with status {tar_status}"
+        return True, bytes_sent, ''
+
     def push_folders(self, site_id: str, folders: List[str], progress_callback: Callable = None) -> Tuple[bool, str, dict]:
         """
-        Push specific folders by compressing, transferring, and extracting on remote
+        Push specific folders by streaming a tarball into tar on the remote
+
+        Folders are streamed concurrently (up to the site's transfer_workers), each
+        on its own session of the pooled connection.
 
         Args:
             site_id: Site identifier
             folders: List of folder paths relative to local_path
-            progress_callback: Optional callback(current, total, message)
+            progress_callback: Optional callback(folders_done, total, message)
 
         Returns:
             Tuple of (success, message, stats_dict)
@@ -528,24 +668,31 @@ class PushController:
             'folders': []
         }
 
+        sftp = None
         try:
-            # Connect to SFTP and SSH
-            sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-            sftp.connect()
+            # Run remote commands over the pooled connection instead of a new handshake
+            sftp = self._sftp_pool.acquire(site, password)
+            ssh = sftp.open_ssh()
 
-            ssh = SSHService(site.remote_host, site.remote_port, site.remote_username, password)
-            ssh.connect()
+            # Use a multi-threaded compressor when both ends have one
+            remote_compressors = ssh.find_programs(PARALLEL_COMPRESSORS)
+            compressor = choose_compressor(local_compressors(), remote_compressors)
+            self.logger.info(f"Compressing folders with {compressor}")
 
+            # Progress is (folders done, total, message); workers report concurrently
+            folders = [folder.strip() for folder in folders if folder.strip()]
             total_folders = len(folders)
+            done = 0
+            lock = threading.Lock()
 
-            for i, folder in enumerate(folders):
-                folder = folder.strip()
-                if not folder:
-                    continue
-
+            def report(message):
                 if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Processing {folder}")
+                    with lock:
+                        progress_callback(done, total_folders, message)
 
+            # Check every folder first, then stream the valid ones side by side
+            folders_to_push = []
+            for folder in folders:
                 # Ensure folder path doesn't start with /
                 if folder.startswith('/'):
                     folder = folder[1:]
@@ -556,111 +703,42 @@ class PushController:
                 if not os.path.exists(local_folder):
                     self.logger.warning(f"Local folder not found: {local_folder}")
                     stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Folder not found: {folder}")
+                    done += 1
+                    report(f"❌ Folder not found: {folder}")
                     continue
 
                 if not os.path.isdir(local_folder):
                     self.logger.warning(f"Path is not a directory: {local_folder}")
                     stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Not a directory: {folder}")
+                    done += 1
+                    report(f"❌ Not a directory: {folder}")
                     continue
 
-                # Count files before compression
-                file_count = sum(len(files) for _, _, files in os.walk(local_folder))
-
-                # Create zip file
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Compressing {folder} ({file_count} files)")
-
-                timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                zip_filename = f"push-folder-{site_id}-{i}-{timestamp}.zip"
-                temp_zip_path = os.path.join(tempfile.gettempdir(), zip_filename)
-
-                try:
-                    with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        # Walk through the directory
-                        files_added = 0
-                        for root, dirs, files in os.walk(local_folder):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                # Calculate relative path from local_path (not local_folder)
-                                arcname = os.path.relpath(file_path, site.local_path)
-                                zipf.write(file_path, arcname)
-                                files_added += 1
-
-                                # Update progress every 50 files
-                                if progress_callback and files_added % 50 == 0:
-                                    progress_callback(i + 1, total_folders,
-                                                    f"Compressing {folder} ({files_added}/{file_count} files)")
-
-                    zip_size = os.path.getsize(temp_zip_path)
-                    zip_size_mb = zip_size / (1024 * 1024)
-                    self.logger.info(f"Created zip: {temp_zip_path} ({zip_size} bytes)")
-
-                except Exception as e:
-                    self.logger.error(f"Failed to create zip for {folder}: {e}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Compression failed: {folder}")
-                    if os.path.exists(temp_zip_path):
-                        os.remove(temp_zip_path)
-                    continue
-
-                # Upload zip file
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Uploading {folder} ({zip_size_mb:.1f} MB)")
-
-                remote_zip_path = f"/tmp/{zip_filename}"
-                success, message = sftp.upload_file(temp_zip_path, remote_zip_path)
-
-                if not success:
-                    self.logger.error(f"Failed to upload zip for {folder}: {message}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Upload failed: {folder}")
-                    os.remove(temp_zip_path)
-                    continue
-
-                stats['bytes_transferred'] += zip_size
-
-                # Extract on remote
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Extracting {folder} on remote...")
-
-                # Extract directly to remote_path, which will overwrite existing files
-                extract_command = f"cd {site.remote_path} && unzip -o {remote_zip_path}"
-                success, output, error = ssh.execute_command(extract_command)
-
-                if not success:
-                    self.logger.error(f"Failed to extract {folder}: {error}")
-                    stats['folders_failed'] += 1
-                    if progress_callback:
-                        progress_callback(i + 1, total_folders, f"❌ Extraction failed: {folder}")
-                    # Clean up remote zip
-                    ssh.execute_command(f"rm -f {remote_zip_path}")
-                    os.remove(temp_zip_path)
-                    continue
-
-                # Clean up remote zip file
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"Cleaning up {folder}...")
-                ssh.execute_command(f"rm -f {remote_zip_path}")
-
-                # Clean up local temp file
-                os.remove(temp_zip_path)
-
-                stats['folders_pushed'] += 1
-                stats['folders'].append(folder)
-                self.logger.info(f"Successfully pushed folder: {folder}")
-
-                if progress_callback:
-                    progress_callback(i + 1, total_folders, f"✓ Completed {folder}")
+                folders_to_push.append(folder)
+
+            # Each folder streams on its own session of the shared connection
+            workers = max(1, min(site.transfer_workers, len(folders_to_push)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._push_folder, ssh, site, folder, compressor,
+                                       remote_compressors, report): folder
+                           for folder in folders_to_push}
+                for future in as_completed(futures):
+                    folder = futures[future]
+                    success, bytes_sent, error = future.result()
+                    stats['bytes_transferred'] += bytes_sent
+                    with lock:
+                        done += 1
+
+                    if not success:
+                        self.logger.error(f"Failed to push {folder}: {error}")
+                        stats['folders_failed'] += 1
+                        report(f"❌ Transfer failed: {folder}")
+                        continue
 
-            # Disconnect
-            sftp.disconnect()
-            ssh.disconnect()
+                    stats['folders_pushed'] += 1
+                    stats['folders'].append(folder)
+                    self.logger.info(f"Successfully pushed folder: {folder}")
+                    report(f"✓ Completed {folder}")
 
             if stats['folders_pushed'] == 0 and stats['folders_failed'] > 0:
                 return False, f"All folders failed to push", stats
@@ -676,3 +754,8 @@ class PushController:
             error_msg = f"Push folders failed: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg, stats
+
+        finally:
+            # Return the connection to the pool (a dead one is closed instead)
+            if sftp is not None:
+                self._sftp_pool.release(site_id, sftp)
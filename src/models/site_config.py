@@ -36,6 +36,8 @@ class SiteConfig:
     pull_include_paths: List[str] = field(default_factory=list)
     push_newer_only: bool = True  # Only push/pull files newer than remote/local
     use_compression: bool = True  # Compress folders before transfer (faster for many files)
+    transfer_workers: int = 4  # Parallel SFTP sessions used for file push/pull
+    ssh_window_mb: int = 32  # SSH channel window for transfers (raise for high-latency links)
     compress_folders: List[str] = field(default_factory=lambda: [
         "wp-content/plugins/",
         "wp-content/themes/"
@@ -63,6 +65,8 @@ class SiteConfig:
             'pull_include_paths': self.pull_include_paths,
             'push_newer_only': self.push_newer_only,
             'use_compression': self.use_compression,
+            'transfer_workers': self.transfer_workers,
+            'ssh_window_mb': self.ssh_window_mb,
             'compress_folders': self.compress_folders,
             'last_db_pushed_at': self.last_db_pushed_at,
             'last_db_pulled_at': self.last_db_pulled_at,
@@ -1,6 +1,7 @@
 """
 Configuration service for managing site configurations
 """
+import copy
 import yaml
 import keyring
 import json
@@ -22,6 +23,10 @@ class ConfigService:
         self.sites_file = self.config_dir / 'sites.yaml'
         self.sync_state_file = self.config_dir / 'sync_state.json'
 
+        # Parsed sites.yaml as (file signature, site dicts), reused until the file changes;
+        # every load builds fresh SiteConfigs so callers never share (and mutate) cached objects
+        self._sites_cache = (None, [])
+
         # Initialize files if they don't exist
         if not self.sites_file.exists():
             self._save_sites([])
@@ -33,16 +38,34 @@ class ConfigService:
         data = {'sites': [site.to_dict() for site in sites]}
         with open(self.sites_file, 'w') as f:
             yaml.dump(data, f, default_flow_style=False)
+        self._sites_cache = (self._sites_signature(), copy.deepcopy(data['sites']))
         self.logger.info(f"Saved {len(sites)} site(s) to configuration")
 
-    def _load_sites(self) -> List[SiteConfig]:
-        """Load sites from YAML file"""
+    def _sites_signature(self):
+        """Modification time and size of sites.yaml, or None if it can't be read"""
         try:
-            with open(self.sites_file, 'r') as f:
-                data = yaml.safe_load(f)
-                if data and 'sites' in data:
-                    return [SiteConfig.from_dict(site) for site in data['sites']]
+            st = self.sites_file.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_sites(self) -> List[SiteConfig]:
+        """Load sites from YAML file (parsed again only when the file has changed)"""
+        signature = self._sites_signature()
+        cached_signature, cached_sites = self._sites_cache
+        if signature is None or signature != cached_signature:
+            try:
+                with open(self.sites_file, 'r') as f:
+                    data = yaml.safe_load(f)
+                    cached_sites = data['sites'] if data and data.get('sites') else []
+            except Exception as e:
+                self.logger.error(f"Error loading sites: {e}")
                 return []
+            self._sites_cache = (signature, cached_sites)
+
+        # from_dict consumes its dict, so it gets a copy
+        try:
+            return [SiteConfig.from_dict(copy.deepcopy(site)) for site in cached_sites]
         except Exception as e:
             self.logger.error(f"Error loading sites: {e}")
             return []
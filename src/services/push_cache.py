@@ -0,0 +1,112 @@
+"""
+Fingerprints of pushed files, used to skip re-uploading unchanged files
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from ..utils.logger import setup_logger
+
+# Bytes read per step when hashing a file
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """Return the BLAKE2b hex digest of a file's contents"""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PushCache:
+    """
+    Remembers what each file looked like locally and remotely when it was last pushed
+
+    A file is unchanged when the remote copy still has the size and mtime recorded after
+    the upload, and the local file still has the recorded mtime and size (or, if only its
+    mtime changed, e.g. after a git checkout, the same content hash).
+    """
+
+    def __init__(self, cache_file: Path):
+        """
+        Load the cache for a site
+
+        Args:
+            cache_file: JSON file the cache is stored in
+        """
+        self.logger = setup_logger('push_cache')
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._entries = {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable push cache {self.cache_file}: {e}")
+
+    def is_unchanged(self, rel_path: str, local_path: str, remote_attr) -> bool:
+        """
+        Check whether a file is identical to what was last pushed
+
+        Args:
+            rel_path: Path relative to the site root (cache key)
+            local_path: Local file path
+            remote_attr: SFTP attributes of the remote file, or None if it doesn't exist
+
+        Returns:
+            True if the upload can be skipped
+        """
+        with self._lock:
+            entry = self._entries.get(rel_path)
+        if not entry or remote_attr is None:
+            return False
+
+        mtime_ns, size, digest, remote_mtime, remote_size = entry
+        if (int(remote_attr.st_mtime), remote_attr.st_size) != (remote_mtime, remote_size):
+            return False
+
+        st = os.stat(local_path)
+        if (st.st_mtime_ns, st.st_size) == (mtime_ns, size):
+            return True
+        if st.st_size != size or file_digest(local_path) != digest:
+            return False
+
+        # Same content with a new mtime; remember it so the next run skips the hash
+        with self._lock:
+            self._entries[rel_path] = [st.st_mtime_ns, size, digest, remote_mtime, remote_size]
+        return True
+
+    def record(self, rel_path: str, local_path: str, remote_attr):
+        """
+        Remember a file that was just uploaded
+
+        Args:
+            rel_path: Path relative to the site root (cache key)
+            local_path: Local file path
+            remote_attr: SFTP attributes of the uploaded remote file (nothing is recorded if None)
+        """
+        if remote_attr is None:
+            return
+        st = os.stat(local_path)
+        entry = [st.st_mtime_ns, st.st_size, file_digest(local_path),
+                 int(remote_attr.st_mtime), remote_attr.st_size]
+        with self._lock:
+            self._entries[rel_path] = entry
+
+    def save(self):
+        """Write the cache back to disk"""
+        with self._lock:
+            data = dict(self._entries)
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"Could not save push cache {self.cache_file}: {e}")
@@ -3,17 +3,28 @@ SFTP service for file transfer operations
 """
 import paramiko
 import os
+import queue
 import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Dict, Iterable, Iterator, Any, Optional
 from datetime import datetime
+from .ssh_service import SSHService, WINDOW_SIZE, tune_transport
 from ..utils.logger import setup_logger
 
+KEEPALIVE_INTERVAL = 30
+# Outstanding read requests kept in flight while downloading (OpenSSH sftp -R default)
+MAX_PREFETCH_REQUESTS = 64
+# Chunk size for uploads; a multiple of the 32 KiB SFTP write request size
+BUFFER_SIZE = 1 << 20
+
 
 class SFTPService:
     """Handles SFTP operations for file transfer"""
 
-    def __init__(self, host: str, port: int, username: str, password: str = None, key_path: str = None):
+    def __init__(self, host: str, port: int, username: str, password: str = None, key_path: str = None,
+                 window_size: int = WINDOW_SIZE):
         """
         Initialize SFTP service
 
@@ -23,6 +34,7 @@ class SFTPService:
             username: SFTP username
             password: SFTP password (optional if using key)
             key_path: Path to SSH private key (optional)
+            window_size: SSH channel window in bytes; large enough that prefetched reads never stall on it
         """
         self.logger = setup_logger('sftp')
         self.host = host
@@ -30,9 +42,12 @@ class SFTPService:
         self.username = username
         self.password = password
         self.key_path = key_path
+        self.window_size = window_size
 
         self.ssh_client = None
         self.sftp_client = None
+        self._owns_transport = True
+        self.max_prefetch_requests = MAX_PREFETCH_REQUESTS
 
     def connect(self):
         """Establish SFTP connection"""
@@ -58,7 +73,8 @@ class SFTPService:
                     password=self.password
                 )
 
-            self.sftp_client = self.ssh_client.open_sftp()
+            tune_transport(self.ssh_client.get_transport(), self.window_size)
+            self.sftp_client = self._open_sftp()
             self.logger.info("SFTP connection established")
             return True
 
@@ -66,12 +82,109 @@ class SFTPService:
             self.logger.error(f"Failed to connect: {e}")
             raise ConnectionError(f"Failed to connect to SFTP server: {e}")
 
+    def _open_sftp(self) -> paramiko.SFTPClient:
+        """Open an SFTP session on the SSH transport with a large channel window"""
+        return paramiko.SFTPClient.from_transport(self.ssh_client.get_transport(),
+                                                  window_size=self.window_size)
+
+    def is_connected(self) -> bool:
+        """Check whether the underlying SSH transport is still alive"""
+        if not self.ssh_client or not self.sftp_client:
+            return False
+        transport = self.ssh_client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def set_keepalive(self, interval: int):
+        """Send SSH keepalive packets every interval seconds"""
+        transport = self.ssh_client.get_transport() if self.ssh_client else None
+        if transport:
+            transport.set_keepalive(interval)
+
+    def open_channel(self) -> 'SFTPService':
+        """
+        Open another SFTP session over this connection's SSH transport
+
+        The session shares the transport (no new handshake); disconnecting it only
+        closes the session.
+
+        Returns:
+            SFTPService bound to the new session
+        """
+        channel = SFTPService(self.host, self.port, self.username, self.password, self.key_path,
+                              self.window_size)
+        channel.ssh_client = self.ssh_client
+        channel.sftp_client = self._open_sftp()
+        channel._owns_transport = False
+        return channel
+
+    def open_ssh(self) -> SSHService:
+        """
+        Get an SSHService that runs commands over this connection's SSH transport
+
+        Like an OpenSSH control master: commands open sessions on the existing
+        connection, skipping the TCP and SSH handshakes. Disconnecting the returned
+        service leaves this connection open.
+
+        Returns:
+            SSHService bound to this connection
+        """
+        ssh = SSHService(self.host, self.port, self.username, self.password, self.key_path,
+                         self.window_size)
+        ssh.ssh_client = self.ssh_client
+        ssh._owns_client = False
+        return ssh
+
+    def transfer_parallel(self, items: Iterable, transfer: Callable, max_workers: int) -> Iterator[Tuple[Any, Any]]:
+        """
+        Run transfer(channel, item) for each item over several SFTP sessions at once
+
+        SFTP transfers are latency bound, so keeping a few files in flight on separate
+        sessions of the same SSH transport hides most of the per-request round-trips.
+
+        Args:
+            items: Items to transfer
+            transfer: Callable(channel, item) run on a worker thread with a free session
+            max_workers: Maximum number of concurrent sessions (including this one)
+
+        Yields:
+            (item, result) tuples in completion order
+        """
+        items = list(items)
+        channels = queue.Queue()
+        channels.put(self)
+        extra_channels = []
+        for _ in range(min(max_workers, len(items)) - 1):
+            try:
+                channel = self.open_channel()
+            except Exception as e:
+                # Servers may cap sessions per connection; use what we got
+                self.logger.warning(f"Could not open extra SFTP session: {e}")
+                break
+            extra_channels.append(channel)
+            channels.put(channel)
+
+        def run(item):
+            channel = channels.get()
+            try:
+                return transfer(channel, item)
+            finally:
+                channels.put(channel)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(extra_channels) + 1) as pool:
+                futures = {pool.submit(run, item): item for item in items}
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+        finally:
+            for channel in extra_channels:
+                channel.disconnect()
+
     def disconnect(self):
         """Close SFTP connection"""
         try:
             if self.sftp_client:
                 self.sftp_client.close()
-            if self.ssh_client:
+            if self.ssh_client and self._owns_transport:
                 self.ssh_client.close()
             self.logger.info("SFTP connection closed")
         except Exception as e:
@@ -111,7 +224,13 @@ class SFTPService:
             try:
                 self.sftp_client.stat(directory)
             except FileNotFoundError:
-                self.sftp_client.mkdir(directory)
+                try:
+                    self.sftp_client.mkdir(directory)
+                except IOError:
+                    # Another session may have created it in the meantime
+                    if not self.path_exists(directory):
+                        raise
+                    continue
                 self.logger.info(f"Created remote directory: {directory}")
 
     def upload_file(self, local_path: str, remote_path: str, progress_callback: Callable = None) -> Tuple[bool, str]:
@@ -135,11 +254,26 @@ class SFTPService:
             # Upload file
             file_size = os.path.getsize(local_path)
 
-            def progress_wrapper(bytes_transferred, total_bytes):
-                if progress_callback:
-                    progress_callback(bytes_transferred, total_bytes)
-
-            self.sftp_client.put(local_path, remote_path, callback=progress_wrapper if progress_callback else None)
+            # Pipelined writes in BUFFER_SIZE chunks: paramiko splits each chunk into
+            # full-size write requests and doesn't wait for every ack
+            bytes_transferred = 0
+            with open(local_path, 'rb') as local_file, \
+                    self.sftp_client.open(remote_path, 'wb', bufsize=BUFFER_SIZE) as remote_file:
+                remote_file.set_pipelined(True)
+                while True:
+                    chunk = local_file.read(BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    remote_file.write(chunk)
+                    bytes_transferred += len(chunk)
+                    if progress_callback:
+                        progress_callback(bytes_transferred, file_size)
+
+            # Confirm the remote size, as put(confirm=True) does - pipelined writes
+            # aren't acknowledged one by one, so a short file would otherwise pass
+            remote_size = self.sftp_client.stat(remote_path).st_size
+            if remote_size != bytes_transferred:
+                raise IOError(f"size mismatch in upload: {remote_size} != {bytes_transferred}")
 
             # Preserve file permissions
             local_stat = os.stat(local_path)
@@ -179,7 +313,9 @@ class SFTPService:
                 if progress_callback:
                     progress_callback(bytes_transferred, total_bytes)
 
-            self.sftp_client.get(remote_path, local_path, callback=progress_wrapper if progress_callback else None)
+            # get() prefetches; bound the requests in flight instead of queueing the whole file
+            self.sftp_client.get(remote_path, local_path, callback=progress_wrapper if progress_callback else None,
+                                 max_concurrent_prefetch_requests=self.max_prefetch_requests)
 
             file_size = os.path.getsize(local_path)
             self.logger.info(f"Downloaded: {remote_path} -> {local_path} ({self._format_bytes(file_size)})")
@@ -239,6 +375,13 @@ class SFTPService:
         except FileNotFoundError:
             return False
 
+    def get_remote_stat(self, remote_path: str) -> Optional[paramiko.SFTPAttributes]:
+        """Get attributes of a remote path, or None if it doesn't exist"""
+        try:
+            return self.sftp_client.stat(remote_path)
+        except FileNotFoundError:
+            return None
+
     def get_remote_mtime(self, remote_path: str) -> float:
         """
         Get modification time of a remote file
@@ -334,3 +477,65 @@ class SFTPService:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.disconnect()
+
+
+class SFTPPool:
+    """Keeps one idle SFTP connection per site so consecutive operations skip the SSH handshake"""
+
+    def __init__(self):
+        self.logger = setup_logger('sftp')
+        self._idle: Dict[str, SFTPService] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, site, password: str) -> SFTPService:
+        """
+        Get a connected SFTPService for a site, reusing an idle one if possible
+
+        The connection is owned by the caller until it is handed back with release().
+
+        Args:
+            site: SiteConfig to connect to
+            password: SSH password
+
+        Returns:
+            Connected SFTPService
+        """
+        with self._lock:
+            sftp = self._idle.pop(site.id, None)
+
+        window_size = site.ssh_window_mb << 20
+        if sftp is not None:
+            if sftp.is_connected() and (sftp.host, sftp.port, sftp.username, sftp.password, sftp.window_size) == \
+                    (site.remote_host, site.remote_port, site.remote_username, password, window_size):
+                return sftp
+            sftp.disconnect()
+
+        sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password,
+                           window_size=window_size)
+        sftp.connect()
+        sftp.set_keepalive(KEEPALIVE_INTERVAL)
+        return sftp
+
+    def release(self, site_id: str, sftp: SFTPService):
+        """Return a connection to the pool, closing it if it is dead or the slot is taken"""
+        if sftp.is_connected():
+            with self._lock:
+                if site_id not in self._idle:
+                    self._idle[site_id] = sftp
+                    return
+        sftp.disconnect()
+
+    def invalidate(self, site_id: str):
+        """Close and forget the idle connection for a site"""
+        with self._lock:
+            sftp = self._idle.pop(site_id, None)
+        if sftp is not None:
+            sftp.disconnect()
+
+    def close_all(self):
+        """Close every idle connection (on application exit)"""
+        with self._lock:
+            idle = list(self._idle.values())
+            self._idle.clear()
+        for sftp in idle:
+            sftp.disconnect()
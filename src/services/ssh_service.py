@@ -2,14 +2,47 @@
 SSH service for remote command execution
 """
 import paramiko
-from typing import Tuple, Optional
+import shlex
+import socket
+from typing import Tuple, Optional, Callable, BinaryIO, Iterable, Set, Dict, NamedTuple
 from ..utils.logger import setup_logger
 
+# Bytes moved per read/send when streaming data to or from a remote command
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Default SSH channel window (paramiko's 2 MiB caps throughput at window/RTT on long links)
+WINDOW_SIZE = 1 << 25
+
+
+class RemoteStat(NamedTuple):
+    """Modification time and size of a remote file (same field names as paramiko.SFTPAttributes)"""
+    st_mtime: float
+    st_size: int
+
+
+def tune_transport(transport: paramiko.Transport, window_size: int):
+    """
+    Tune a connected transport for bulk transfers
+
+    Disables Nagle's algorithm so small SFTP requests and acks aren't held back,
+    and makes channels opened from now on use window_size.
+
+    Args:
+        transport: Connected SSH transport
+        window_size: Channel window in bytes
+    """
+    try:
+        transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):
+        pass  # Not a TCP socket (e.g. a proxy command)
+    transport.default_window_size = window_size
+
 
 class SSHService:
     """Handles SSH operations for remote command execution"""
 
-    def __init__(self, host: str, port: int, username: str, password: str = None, key_path: str = None):
+    def __init__(self, host: str, port: int, username: str, password: str = None, key_path: str = None,
+                 window_size: int = WINDOW_SIZE):
         """
         Initialize SSH service
 
@@ -19,6 +52,7 @@ class SSHService:
             username: SSH username
             password: SSH password (optional if using key)
             key_path: Path to SSH private key (optional)
+            window_size: SSH channel window in bytes
         """
         self.logger = setup_logger('ssh')
         self.host = host
@@ -26,8 +60,10 @@ class SSHService:
         self.username = username
         self.password = password
         self.key_path = key_path
+        self.window_size = window_size
 
         self.ssh_client = None
+        self._owns_client = True
 
     def connect(self):
         """Establish SSH connection"""
@@ -53,6 +89,7 @@ class SSHService:
                     password=self.password
                 )
 
+            tune_transport(self.ssh_client.get_transport(), self.window_size)
             self.logger.info("SSH connection established")
             return True
 
@@ -63,7 +100,7 @@ class SSHService:
     def disconnect(self):
         """Close SSH connection"""
         try:
-            if self.ssh_client:
+            if self.ssh_client and self._owns_client:
                 self.ssh_client.close()
             self.logger.info("SSH connection closed")
         except Exception as e:
@@ -110,6 +147,210 @@ class SSHService:
             self.logger.error(error_msg)
             return False, "", str(e)
 
+    def _exec_channel(self, command: str, timeout: int) -> paramiko.Channel:
+        """Open a session channel to run a command on"""
+        if not self.ssh_client:
+            raise ConnectionError("Not connected to SSH server")
+
+        channel = self.ssh_client.get_transport().open_session()
+        channel.settimeout(timeout)
+        return channel
+
+    def stream_to_command(self, command: str, source: BinaryIO, progress_callback: Callable = None,
+                          timeout: int = 300) -> Tuple[bool, int, str]:
+        """
+        Execute a command on remote server, feeding it source on stdin
+
+        Args:
+            command: Shell command to execute
+            source: Binary file-like object read until EOF
+            progress_callback: Optional callback(bytes_sent)
+            timeout: Timeout in seconds for each network operation
+
+        Returns:
+            Tuple of (success, bytes_sent, output) with stdout and stderr combined in output
+        """
+        bytes_sent = 0
+        try:
+            self.logger.info(f"Streaming to command: {command}")
+
+            channel = self._exec_channel(command, timeout)
+            try:
+                channel.set_combine_stderr(True)
+                channel.exec_command(command)
+
+                while True:
+                    chunk = source.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    channel.sendall(chunk)
+                    bytes_sent += len(chunk)
+                    if progress_callback:
+                        progress_callback(bytes_sent)
+                channel.shutdown_write()
+
+                output = channel.makefile('rb').read().decode('utf-8', errors='replace')
+                exit_status = channel.recv_exit_status()
+            finally:
+                channel.close()
+
+            if exit_status != 0:
+                self.logger.error(f"Command failed with exit status {exit_status}")
+                self.logger.error(f"output: {output}")
+            return exit_status == 0, bytes_sent, output
+
+        except Exception as e:
+            error_msg = f"Error streaming to command: {e}"
+            self.logger.error(error_msg)
+            return False, bytes_sent, str(e)
+
+    def write_to_command(self, command: str, write: Callable[[BinaryIO], None],
+                         timeout: int = 300) -> Tuple[bool, str]:
+        """
+        Execute a command on remote server, letting write() produce its stdin
+
+        Args:
+            command: Shell command to execute
+            write: Callable(stdin) writing the command's input to a binary file-like object
+            timeout: Timeout in seconds for each network operation
+
+        Returns:
+            Tuple of (success, output) with stdout and stderr combined in output
+        """
+        try:
+            self.logger.info(f"Streaming to command: {command}")
+
+            channel = self._exec_channel(command, timeout)
+            try:
+                channel.set_combine_stderr(True)
+                channel.exec_command(command)
+
+                with channel.makefile('wb', STREAM_CHUNK_SIZE) as stdin:
+                    write(stdin)
+                channel.shutdown_write()
+
+                output = channel.makefile('rb').read().decode('utf-8', errors='replace')
+                exit_status = channel.recv_exit_status()
+            finally:
+                channel.close()
+
+            if exit_status != 0:
+                self.logger.error(f"Command failed with exit status {exit_status}")
+                self.logger.error(f"output: {output}")
+            return exit_status == 0, output
+
+        except Exception as e:
+            error_msg = f"Error streaming to command: {e}"
+            self.logger.error(error_msg)
+            return False, str(e)
+
+    def stream_from_command(self, command: str, sink: BinaryIO, progress_callback: Callable = None,
+                            timeout: int = 300) -> Tuple[bool, int, str]:
+        """
+        Execute a command on remote server, writing its stdout to sink
+
+        Args:
+            command: Shell command to execute
+            sink: Binary file-like object receiving stdout
+            progress_callback: Optional callback(bytes_received)
+            timeout: Timeout in seconds for each network operation
+
+        Returns:
+            Tuple of (success, bytes_received, stderr)
+        """
+        bytes_received = 0
+        try:
+            self.logger.info(f"Streaming from command: {command}")
+
+            channel = self._exec_channel(command, timeout)
+            try:
+                channel.exec_command(command)
+
+                while True:
+                    chunk = channel.recv(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sink.write(chunk)
+                    bytes_received += len(chunk)
+                    if progress_callback:
+                        progress_callback(bytes_received)
+
+                stderr_text = channel.makefile_stderr('rb').read().decode('utf-8', errors='replace')
+                exit_status = channel.recv_exit_status()
+            finally:
+                channel.close()
+
+            if exit_status != 0:
+                self.logger.error(f"Command failed with exit status {exit_status}")
+                self.logger.error(f"stderr: {stderr_text}")
+            return exit_status == 0, bytes_received, stderr_text
+
+        except Exception as e:
+            error_msg = f"Error streaming from command: {e}"
+            self.logger.error(error_msg)
+            return False, bytes_received, str(e)
+
+    def stat_files(self, directory: str, paths: Iterable[str]) -> Dict[str, RemoteStat]:
+        """
+        Get the mtime and size of many remote files with a single command
+
+        The paths go to the remote's stdin, so one session replaces a stat
+        round-trip per file. Files that don't exist are left out; if the listing
+        fails altogether (e.g. a find without -printf) the result is empty, so
+        every file just looks missing on the remote.
+
+        Args:
+            directory: Directory the paths are relative to
+            paths: File paths
+
+        Returns:
+            Dict of path -> RemoteStat
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+
+        def write(stdin):
+            # ./ keeps names starting with '-' from being read as find options
+            for path in paths:
+                stdin.write(f"./{path}\0".encode('utf-8'))
+
+        find = 'find "$@" -maxdepth 0 -type f -printf "%T@ %s %p\\0"'
+        command = f"cd {shlex.quote(directory)} && xargs -0 -r sh -c '{find}' sh 2>/dev/null; true"
+        success, output = self.write_to_command(command, write)
+        if not success:
+            self.logger.warning(f"Could not list remote files: {output}")
+            return {}
+
+        files = {}
+        for record in output.split('\0'):
+            if not record:
+                continue
+            try:
+                mtime, size, path = record.split(' ', 2)
+                files[path[2:]] = RemoteStat(float(mtime), int(size))
+            except ValueError:
+                self.logger.warning(f"Unexpected remote listing entry: {record!r}")
+        return files
+
+    def find_programs(self, names: Iterable[str]) -> Set[str]:
+        """
+        Check which programs are on the remote PATH
+
+        Args:
+            names: Program names to look for
+
+        Returns:
+            Set of the names that were found
+        """
+        names = list(names)
+        command = (f"for p in {' '.join(names)}; do "
+                   f"command -v \"$p\" >/dev/null 2>&1 && echo \"$p\"; done; true")
+        success, stdout, stderr = self.execute_command(command, timeout=30)
+        if not success:
+            return set()
+        return set(stdout.split()) & set(names)
+
     def test_wp_cli(self, wordpress_path: str) -> Tuple[bool, str]:
         """
         Test if WP-CLI is available on remote server
@@ -1,10 +1,14 @@
 """
 Database configuration dialog
 """
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from ..models.database_config import DatabaseConfig
 
+# Matches each non-whitespace run (one table name per match)
+_NONWS = re.compile(r"\S+")
+
 
 class DatabaseDialog:
     """Dialog for configuring database settings"""
@@ -14,6 +18,9 @@ class DatabaseDialog:
         self.site = site
         self.result = None
 
+        # SSH connection shared by remote actions, opened lazily and kept until close
+        self._ssh = None
+
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"Database Configuration - {site.name}")
         self.dialog.geometry("800x700")
@@ -36,15 +43,10 @@ class DatabaseDialog:
         # Setup click-through focus handling for macOS
         self._setup_focus_handling()
 
-        # Better focus handling for macOS
-        self.dialog.update_idletasks()
+        # Better focus handling for macOS (geometry was already flushed when centering)
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
-
-        # Force event processing
-        self.dialog.update()
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
 
         # Set focus to first field after a slight delay to ensure window is ready
@@ -57,6 +59,9 @@ class DatabaseDialog:
         # Bind Escape key to cancel
         self.dialog.bind('<Escape>', lambda e: self.cancel())
 
+        # Release the shared SSH connection if the window manager closes the dialog
+        self.dialog.bind('<Destroy>', self._on_destroy)
+
     def _setup_focus_handling(self):
         """Setup click-through focus handling for macOS dialogs"""
         import platform
@@ -92,6 +97,45 @@ class DatabaseDialog:
         except ImportError:
             pass
 
+    def _get_ssh(self):
+        """
+        Get the dialog's SSH connection, connecting on first use or after it dropped
+
+        Returns:
+            Connected SSHService, or None if no SSH password is stored
+        """
+        if self._ssh is not None:
+            # execute_command swallows errors, so a dead transport must be caught here
+            transport = self._ssh.ssh_client.get_transport() if self._ssh.ssh_client else None
+            if transport is None or not transport.is_active():
+                self._close_ssh()
+
+        if self._ssh is None:
+            from ..services.ssh_service import SSHService
+            from ..services.sftp_service import KEEPALIVE_INTERVAL
+
+            ssh_password = self.config_service.get_password(self.site.id)
+            if not ssh_password:
+                return None
+
+            ssh_service = SSHService(self.site.remote_host, self.site.remote_port,
+                                     self.site.remote_username, ssh_password)
+            ssh_service.connect()
+            ssh_service.ssh_client.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
+            self._ssh = ssh_service
+        return self._ssh
+
+    def _close_ssh(self):
+        """Close the shared SSH connection if one is open"""
+        if self._ssh:
+            self._ssh.disconnect()
+            self._ssh = None
+
+    def _on_destroy(self, event):
+        """Handle destroy event to release the SSH connection"""
+        if event.widget == self.dialog:
+            self._close_ssh()
+
     def _on_focus_in(self, event):
         """Handle focus in event to keep dialog on top"""
         if event.widget == self.dialog:
@@ -105,6 +149,9 @@ class DatabaseDialog:
 
     def create_widgets(self):
         """Create dialog widgets"""
+        # Shared style for the gray hint labels
+        ttk.Style(self.dialog).configure("Hint.TLabel", foreground="gray")
+
         # Main frame with scrollbar
         main_frame = ttk.Frame(self.dialog, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -114,9 +161,10 @@ class DatabaseDialog:
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
+        # Scroll region follows the frame's own size (no bbox walk over children)
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -173,7 +221,7 @@ class DatabaseDialog:
         self.remote_db_host_entry = ttk.Entry(remote_db_frame, width=40)
         self.remote_db_host_entry.grid(row=row, column=1, sticky=tk.W, pady=5, padx=5)
         self.remote_db_host_entry.insert(0, "localhost")
-        ttk.Label(remote_db_frame, text="(Usually 'localhost' via SSH)", foreground="gray").grid(row=row, column=2, sticky=tk.W, padx=5)
+        ttk.Label(remote_db_frame, text="(Usually 'localhost' via SSH)", style="Hint.TLabel").grid(row=row, column=2, sticky=tk.W, padx=5)
 
         row += 1
         ttk.Label(remote_db_frame, text="Port:").grid(row=row, column=0, sticky=tk.W, pady=5)
@@ -204,13 +252,13 @@ class DatabaseDialog:
         ttk.Label(urls_frame, text="Local URL:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.local_url_entry = ttk.Entry(urls_frame, width=40)
         self.local_url_entry.grid(row=row, column=1, sticky=tk.W, pady=5, padx=5)
-        ttk.Label(urls_frame, text="e.g., http://mysite.local", foreground="gray").grid(row=row, column=2, sticky=tk.W, padx=5)
+        ttk.Label(urls_frame, text="e.g., http://mysite.local", style="Hint.TLabel").grid(row=row, column=2, sticky=tk.W, padx=5)
 
         row += 1
         ttk.Label(urls_frame, text="Remote URL:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.remote_url_entry = ttk.Entry(urls_frame, width=40)
         self.remote_url_entry.grid(row=row, column=1, sticky=tk.W, pady=5, padx=5)
-        ttk.Label(urls_frame, text="e.g., https://mysite.com", foreground="gray").grid(row=row, column=2, sticky=tk.W, padx=5)
+        ttk.Label(urls_frame, text="e.g., https://mysite.com", style="Hint.TLabel").grid(row=row, column=2, sticky=tk.W, padx=5)
 
         # Advanced Options Section
         advanced_frame = ttk.LabelFrame(scrollable_frame, text="Advanced Options", padding=10)
@@ -218,7 +266,7 @@ class DatabaseDialog:
 
         row = 0
         ttk.Label(advanced_frame, text="Exclude Tables:").grid(row=row, column=0, sticky=tk.NW, pady=5)
-        ttk.Label(advanced_frame, text="(one per line)", foreground="gray").grid(row=row, column=1, sticky=tk.W, pady=5)
+        ttk.Label(advanced_frame, text="(one per line)", style="Hint.TLabel").grid(row=row, column=1, sticky=tk.W, pady=5)
 
         row += 1
         self.exclude_tables_text = scrolledtext.ScrolledText(advanced_frame, width=50, height=6)
@@ -352,7 +400,6 @@ class DatabaseDialog:
     def test_remote_connection(self):
         """Test remote database connection"""
         try:
-            from ..services.ssh_service import SSHService
             from ..services.database_service import DatabaseService
 
             # Create temporary database config
@@ -360,25 +407,18 @@ class DatabaseDialog:
             if not db_config:
                 return
 
-            # Get SSH password
-            ssh_password = self.config_service.get_password(self.site.id)
-            if not ssh_password:
+            # Get (or reuse) SSH connection
+            ssh_service = self._get_ssh()
+            if not ssh_service:
                 messagebox.showerror("Error", "SSH password not found. Please configure the site first.")
                 return
 
-            # Create SSH service
-            ssh_service = SSHService(self.site.remote_host, self.site.remote_port,
-                                    self.site.remote_username, ssh_password)
-
             # Create temporary site config
             temp_site = self.site
             temp_site.database_config = db_config
 
             db_service = DatabaseService(temp_site, ssh_service)
 
-            # Connect and test
-            ssh_service.connect()
-
             # Test WP-CLI remotely
             success, version = db_service.verify_wp_cli_remote()
 
@@ -399,17 +439,18 @@ class DatabaseDialog:
                                    f"WP-CLI not found on remote server.\n\n{version}\n\n"
                                    f"Please contact your hosting provider.")
 
-            ssh_service.disconnect()
-
         except Exception as e:
+            # Drop the connection so the next attempt starts fresh
+            self._close_ssh()
             messagebox.showerror("Error", f"Test failed: {str(e)}")
 
     def get_database_config(self):
         """Get database configuration from form"""
         try:
             # Get exclude tables
-            exclude_text = self.exclude_tables_text.get('1.0', tk.END).strip()
-            exclude_tables = [t.strip() for t in exclude_text.split('\n') if t.strip()]
+            exclude_tables = list(dict.fromkeys(
+                _NONWS.findall(self.exclude_tables_text.get('1.0', tk.END))
+            ))
 
             db_config = DatabaseConfig(
                 local_db_name=self.local_db_name_entry.get(),
@@ -466,6 +507,7 @@ class DatabaseDialog:
         # Update site in config
         self.config_service.update_site(self.site)
 
+        self._close_ssh()
         self.result = True
         try:
             self.dialog.grab_release()
@@ -473,6 +515,15 @@ class DatabaseDialog:
             pass
         self.dialog.destroy()
 
+    def _fill_host_port(self, host_entry, port_entry, raw_host):
+        """Fill host/port entries, splitting a "host:port" value (e.g., "localhost:3307")"""
+        host, sep, port = raw_host.partition(':')
+        host_entry.delete(0, tk.END)
+        host_entry.insert(0, host)
+        if sep:
+            port_entry.delete(0, tk.END)
+            port_entry.insert(0, port)
+
     def auto_detect_local_database(self):
         """Auto-detect local database configuration from wp-config.php"""
         try:
@@ -505,16 +556,8 @@ class DatabaseDialog:
                 self.local_db_password_entry.insert(0, config['db_password'])
 
             if config['db_host']:
-                # Parse host and port if host contains port (e.g., "localhost:3307")
-                if ':' in config['db_host']:
-                    host, port = config['db_host'].split(':', 1)
-                    self.local_db_host_entry.delete(0, tk.END)
-                    self.local_db_host_entry.insert(0, host)
-                    self.local_db_port_entry.delete(0, tk.END)
-                    self.local_db_port_entry.insert(0, port)
-                else:
-                    self.local_db_host_entry.delete(0, tk.END)
-                    self.local_db_host_entry.insert(0, config['db_host'])
+                self._fill_host_port(self.local_db_host_entry, self.local_db_port_entry,
+                                     config['db_host'])
 
             # Try to get site URL using WP-CLI
             site_url = config.get('site_url') or config.get('home_url')
@@ -538,24 +581,16 @@ class DatabaseDialog:
     def auto_detect_remote_database(self):
         """Auto-detect remote database configuration from wp-config.php"""
         try:
-            from ..services.ssh_service import SSHService
             from ..utils.wp_config_parser import WPConfigParser
 
-            # Get SSH password
-            ssh_password = self.config_service.get_password(self.site.id)
-            if not ssh_password:
+            # Get (or reuse) SSH connection
+            ssh_service = self._get_ssh()
+            if not ssh_service:
                 messagebox.showerror("Error",
                                    "SSH password not found.\n\n"
                                    "Please configure the site first with SSH credentials.")
                 return
 
-            # Create SSH service
-            ssh_service = SSHService(self.site.remote_host, self.site.remote_port,
-                                    self.site.remote_username, ssh_password)
-
-            # Connect
-            ssh_service.connect()
-
             # Read wp-config.php from remote
             import shlex
             wp_config_path = f"{self.site.remote_path}/wp-config.php"
@@ -564,7 +599,6 @@ class DatabaseDialog:
             success, stdout, stderr = ssh_service.execute_command(command)
 
             if not success:
-                ssh_service.disconnect()
                 messagebox.showerror("Error",
                                    f"Could not read wp-config.php from remote server:\n\n{stderr}\n\n"
                                    f"Path: {wp_config_path}")
@@ -587,16 +621,8 @@ class DatabaseDialog:
                 self.remote_db_password_entry.insert(0, config['db_password'])
 
             if config['db_host']:
-                # Parse host and port if host contains port (e.g., "localhost:3307")
-                if ':' in config['db_host']:
-                    host, port = config['db_host'].split(':', 1)
-                    self.remote_db_host_entry.delete(0, tk.END)
-                    self.remote_db_host_entry.insert(0, host)
-                    self.remote_db_port_entry.delete(0, tk.END)
-                    self.remote_db_port_entry.insert(0, port)
-                else:
-                    self.remote_db_host_entry.delete(0, tk.END)
-                    self.remote_db_host_entry.insert(0, config['db_host'])
+                self._fill_host_port(self.remote_db_host_entry, self.remote_db_port_entry,
+                                     config['db_host'])
 
             # Try to get site URL using WP-CLI
             site_url = config.get('site_url') or config.get('home_url')
@@ -611,8 +637,6 @@ class DatabaseDialog:
                 self.remote_url_entry.delete(0, tk.END)
                 self.remote_url_entry.insert(0, site_url)
 
-            ssh_service.disconnect()
-
             messagebox.showinfo("Success",
                               f"Remote database configuration detected!\n\n"
                               f"Database: {config['db_name']}\n"
@@ -621,10 +645,12 @@ class DatabaseDialog:
                               f"URL: {site_url or 'Not detected'}")
 
         except Exception as e:
+            self._close_ssh()
             messagebox.showerror("Error", f"Auto-detection failed:\n\n{str(e)}")
 
     def cancel(self):
         """Cancel and close dialog"""
+        self._close_ssh()
         self.result = False
         try:
             self.dialog.grab_release()
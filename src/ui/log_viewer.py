@@ -7,6 +7,11 @@ import logging
 import queue
 from pathlib import Path
 
+# Number of log lines kept in the viewer
+MAX_LINES = 1000
+# Extra lines allowed before trimming back to MAX_LINES in one delete
+TRIM_SLACK = 100
+
 
 class LogHandler(logging.Handler):
     """Custom logging handler that sends logs to a queue"""
@@ -36,6 +41,9 @@ class LogViewer(ttk.Frame):
         self.text.tag_config("ERROR", foreground="red")
         self.text.tag_config("SUCCESS", foreground="green")
 
+        # Lines currently in the text widget (tracked to avoid querying Tk)
+        self._line_count = 0
+
         # Create queue for logs
         self.log_queue = queue.Queue()
 
@@ -59,28 +67,47 @@ class LogViewer(ttk.Frame):
 
     def check_queue(self):
         """Check for new log entries"""
+        # Bind the hot methods once; the loop may drain thousands of entries
+        batch = []
+        append = batch.append
+        get_nowait = self.log_queue.get_nowait
         while True:
             try:
-                log_entry = self.log_queue.get_nowait()
-                self.add_log(log_entry)
+                append(get_nowait())
             except queue.Empty:
                 break
 
+        if batch:
+            self.add_logs(batch)
+
         # Check again in 100ms
         self.after(100, self.check_queue)
 
     def add_log(self, log_entry):
         """Add a log entry to the viewer"""
-        self.text.insert(tk.END, log_entry + '\n')
+        self.add_logs([log_entry])
+
+    def add_logs(self, log_entries):
+        """Add several log entries to the viewer with a single insert"""
+        # Only follow new output if the view is already at the bottom,
+        # so reading older entries isn't interrupted
+        at_bottom = self.text.yview()[1] >= 0.999
+
+        block = '\n'.join(log_entries) + '\n'
+        self.text.insert(tk.END, block)
 
         # Auto-scroll to bottom
-        self.text.see(tk.END)
+        if at_bottom:
+            self.text.see(tk.END)
 
-        # Limit to last 1000 lines
-        lines = int(self.text.index('end-1c').split('.')[0])
-        if lines > 1000:
-            self.text.delete('1.0', '2.0')
+        # Limit to last MAX_LINES lines, trimming in batches
+        self._line_count += block.count('\n')
+        if self._line_count > MAX_LINES + TRIM_SLACK:
+            excess = self._line_count - MAX_LINES
+            self.text.delete('1.0', f'{excess + 1}.0')
+            self._line_count = MAX_LINES
 
     def clear(self):
         """Clear the log viewer"""
         self.text.delete('1.0', tk.END)
+        self._line_count = 0
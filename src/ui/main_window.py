@@ -3,26 +3,124 @@ Main GUI window for WordPress deployment tool
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-from datetime import datetime, timedelta
-from threading import Thread
+import logging
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from threading import Lock, Thread
+import queue
+import re
 import sys
-import os
+import time
 from pathlib import Path
 from ..services.config_service import ConfigService
-from ..controllers.push_controller import PushController
-from ..controllers.pull_controller import PullController
-from ..controllers.db_push_controller import DBPushController
-from ..controllers.db_pull_controller import DBPullController
+from ..services.sftp_service import SFTPPool
 from ..models.site_config import SiteConfig
+from ..utils.logger import setup_logger, setup_file_logger
 
 # Import Sun Valley theme
 from .. import sv_ttk
-import platform
+
+logger = logging.getLogger('wp-deploy')
+
+_IS_DARWIN = sys.platform == 'darwin'
+
+# Window icon, decoded once after the main window is up
+_ICON_PATH = Path(__file__).parent.parent.parent / 'assets' / 'WPSyncopath.png'
+_icon = None
+
+# Screen size used to center dialogs, looked up on first use
+_screen_size = None
+
+# Maximum number of file paths rendered in the push/pull preview boxes
+MAX_PREVIEW_FILES = 500
+
+# One match per non-blank line, with surrounding whitespace stripped
+_PATH_RE = re.compile(r"^[^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+
+# Milliseconds between applying status text posted from worker threads
+STATUS_DRAIN_MS = 50
+
+# Milliseconds between indeterminate progress bar animation steps
+PROGRESS_ANIMATION_MS = 30
+
+# Milliseconds between checks for messages posted to a progress dialog from a worker
+PROGRESS_POLL_MS = 100
+
+# Minimum seconds between forced app activations from the macOS focus fix
+FOCUS_DEBOUNCE = 1.0
+
+# Per-file progress is buffered and written to the log file in batches of this size
+PROGRESS_RING_SIZE = 256
+
+# Progress summaries shown in the log viewer every this many files (and on completion)
+PROGRESS_LOG_EVERY = 500
+
+# ...and otherwise at most once per this many seconds
+PROGRESS_LOG_INTERVAL = 1.0
+
+# Result toast texts, filled from the controllers' stats dicts
+_PUSH_RESULT = "Push completed!\n\nFiles pushed: {files_pushed}\nBytes transferred: {bytes_transferred}\n"
+_PUSH_ALL_RESULT = "Push All completed!\n\nFiles pushed: {files_pushed}\nBytes transferred: {bytes_transferred}\n"
+_PUSH_COMMITS_RESULT = ("Push from commits completed!\n\nCommits processed: {commits_pushed}\n"
+                        "Files pushed: {files_pushed}\nBytes transferred: {bytes_transferred:,}\n")
+_PULL_RESULT = "Pull completed!\n\nFiles pulled: {files_pulled}\nBytes transferred: {bytes_transferred}\n"
+_PUSH_FOLDERS_RESULT = ("Push folders completed!\n\nFolders pushed: {folders_pushed}\n"
+                        "Bytes transferred: {bytes_transferred:,}\n")
+_PULL_FOLDERS_RESULT = ("Pull folders completed!\n\nFolders pulled: {folders_pulled}\n"
+                        "Bytes transferred: {bytes_transferred:,}\n")
+_FILES_FAILED = "Files failed: {files_failed}\n"
+_FOLDERS_FAILED = "Folders failed: {folders_failed}\n"
+
+# Milliseconds result toasts stay up (errors stay longer; hovering pauses, click closes)
+TOAST_MS = 4000
+TOAST_ERROR_MS = 10000
+
+
+def format_preview_files(paths, total):
+    """
+    Build the lines of a preview list, capped at MAX_PREVIEW_FILES paths
+
+    Args:
+        paths: Iterable of file paths
+        total: Total number of paths (for the "more files" footer)
+
+    Returns:
+        List of lines
+    """
+    shown = list(islice(paths, MAX_PREVIEW_FILES))
+    if total > MAX_PREVIEW_FILES:
+        shown.append(f"… and {total - MAX_PREVIEW_FILES} more files")
+    return shown
+
+
+@lru_cache(maxsize=64)
+def parse_date(text):
+    """Parse a YYYY-MM-DD date to midnight (cached - the date entries rarely change)"""
+    # fromisoformat is a fixed-format parser, much cheaper than strptime
+    return datetime.combine(date.fromisoformat(text), datetime.min.time())
+
+
+def screen_size(widget):
+    """Return the (width, height) of the screen, queried from Tk only once"""
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return _screen_size
+
+
+def center_dialog(dialog, width, height):
+    """Size a dialog and place it in the middle of the screen (no realize pass to read the size back)"""
+    screen_w, screen_h = screen_size(dialog)
+    x = (screen_w - width) // 2
+    y = (screen_h - height) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
 
 
 def setup_dialog_focus(dialog):
     """Setup click-through focus handling for macOS dialogs"""
-    if platform.system() != 'Darwin':
+    if not _IS_DARWIN:
         return
 
     def on_click(event):
@@ -55,19 +153,139 @@ def setup_dialog_focus(dialog):
         pass
 
 
+class BackgroundWorker:
+    """Pool of persistent daemon threads that run queued jobs off the UI thread"""
+
+    def __init__(self, num_workers=4):
+        self.jobs = queue.Queue()
+        for i in range(num_workers):
+            Thread(target=self._run, name=f"wp-deploy-worker-{i}", daemon=True).start()
+
+    def submit(self, func, *args):
+        """Queue func(*args) to run on a worker thread"""
+        self.jobs.put((func, args))
+
+    def _run(self):
+        """Worker loop - run jobs until the application exits"""
+        while True:
+            func, args = self.jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Background job failed: {e}")
+
+
+class ProgressLog:
+    """Buffers per-file progress for the log file, keeping the log viewer to periodic summaries"""
+
+    def __init__(self, label):
+        self.label = label
+        self.ring = deque(maxlen=PROGRESS_RING_SIZE)
+        self.file_logger = setup_file_logger('wp-deploy.progress')
+        self._last_summary = (None, 0.0)
+
+    def record(self, current, total, message):
+        """Record one progress step"""
+        ring = self.ring
+        ring.append((current, total, message))
+        if len(ring) == ring.maxlen:
+            self.flush()
+
+        # Summaries on milestones (once per step, as a step can report several
+        # messages) and otherwise rate-limited, so slow steps still show up
+        last_current, last_time = self._last_summary
+        now = time.monotonic()
+        milestone = current != last_current and (current == total or current % PROGRESS_LOG_EVERY == 0)
+        if milestone or now - last_time >= PROGRESS_LOG_INTERVAL:
+            logger.info("%s: %d/%d - %s", self.label, current, total, message)
+            self._last_summary = (current, now)
+
+    def flush(self):
+        """Write buffered progress steps to the log file"""
+        log = self.file_logger.info
+        for current, total, message in self.ring:
+            log("Progress: %d/%d - %s", current, total, message)
+        self.ring.clear()
+
+
+class StatusPump:
+    """Applies status updates posted from worker threads on one fixed UI tick (idle when nothing is posted)"""
+
+    def __init__(self, root, interval_ms=STATUS_DRAIN_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.queue = queue.SimpleQueue()
+        self._lock = Lock()
+        self._scheduled = False
+
+    def post(self, status, args):
+        """Queue args for a ThrottledStatus (any thread)"""
+        self.queue.put((status, args))
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.root.after(self.interval_ms, self._drain)
+
+    def _drain(self):
+        """Show the newest queued values of each status (runs on the UI thread)"""
+        latest = {}
+        get_nowait = self.queue.get_nowait
+        while True:
+            try:
+                status, args = get_nowait()
+            except queue.Empty:
+                break
+            latest[status] = args
+
+        for status, args in latest.items():
+            if not status.finished:
+                status.variable.set(status.template.format(*args))
+
+        # Keep ticking only while updates keep coming; the next post() restarts the tick
+        with self._lock:
+            if self.queue.empty():
+                self._scheduled = False
+                return
+        self.root.after(self.interval_ms, self._drain)
+
+
+class ThrottledStatus:
+    """Status text for one operation, updated from a worker thread at most once per pump tick"""
+
+    def __init__(self, pump, variable, template):
+        self.pump = pump
+        self.variable = variable
+        self.template = template
+        self.finished = False
+
+    def update(self, *args):
+        """
+        Show the template filled with args
+
+        Only the newest values per tick are formatted and shown, on the UI thread.
+
+        Args:
+            *args: Values for the template
+        """
+        self.pump.post(self, args)
+
+    def finish(self):
+        """Drop updates still queued, so they can't overwrite the operation's final message"""
+        self.finished = True
+
+
 class ProgressDialog:
     """Simple progress dialog for showing operation status"""
 
-    def __init__(self, parent, title, message):
+    def __init__(self, parent, title, message, reusable=False):
+        self.reusable = reusable
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x150")
+        if reusable:
+            self.dialog.protocol("WM_DELETE_WINDOW", self.close)
 
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        center_dialog(self.dialog, 400, 150)
 
         # Setup focus handling for macOS
         setup_dialog_focus(self.dialog)
@@ -81,23 +299,60 @@ class ProgressDialog:
 
         self.progress = ttk.Progressbar(frame, mode='indeterminate', length=300)
         self.progress.pack(pady=10)
-        self.progress.start(10)
+        self.progress.start(PROGRESS_ANIMATION_MS)
 
-        # Make it appear on top
+        # Messages posted from worker threads, applied by a single poll loop
+        self._posted = queue.Queue()
+        self._poll_id = self.dialog.after(PROGRESS_POLL_MS, self._poll)
+
+        # Make it appear on top; drop topmost once the event loop has shown it
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
 
     def update_message(self, message):
         """Update the message text"""
         self.label.config(text=message)
-        self.dialog.update()
+        self.dialog.update_idletasks()
+
+    def post_message(self, message):
+        """Update the message text from a worker thread"""
+        self._posted.put(message)
+
+    def _poll(self):
+        """Show the latest posted message, if any"""
+        message = None
+        while True:
+            try:
+                message = self._posted.get_nowait()
+            except queue.Empty:
+                break
+        if message is not None:
+            self.label.config(text=message)
+        self._poll_id = self.dialog.after(PROGRESS_POLL_MS, self._poll)
+
+    def show(self, title, message):
+        """Show a previously closed reusable dialog again"""
+        self.dialog.title(title)
+        self.label.config(text=message)
+        self.progress.start(PROGRESS_ANIMATION_MS)
+        # Never run two poll loops
+        if self._poll_id is not None:
+            self.dialog.after_cancel(self._poll_id)
+        self._poll_id = self.dialog.after(PROGRESS_POLL_MS, self._poll)
+        self.dialog.deiconify()
+        self.dialog.lift()
 
     def close(self):
-        """Close the dialog"""
+        """Close the dialog (reusable dialogs are only hidden)"""
         self.progress.stop()
-        self.dialog.destroy()
+        if self._poll_id is not None:
+            self.dialog.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self.reusable:
+            self.dialog.withdraw()
+        else:
+            self.dialog.destroy()
 
 
 class FolderInputDialog:
@@ -107,17 +362,12 @@ class FolderInputDialog:
         self.result = None
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("500x350")
 
         # Make modal
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        center_dialog(self.dialog, 500, 350)
 
         # Setup focus handling for macOS
         setup_dialog_focus(self.dialog)
@@ -130,9 +380,14 @@ class FolderInputDialog:
         label = ttk.Label(frame, text=message, wraplength=450)
         label.pack(pady=(0, 10))
 
-        # Text area
-        self.text = scrolledtext.ScrolledText(frame, height=10, width=60)
-        self.text.pack(fill=tk.BOTH, expand=True, pady=10)
+        # Text area (plain Text with a themed scrollbar, one folder per line)
+        text_frame = ttk.Frame(frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.text = tk.Text(text_frame, height=10, width=60, undo=False, wrap=tk.NONE)
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         if initial_value:
             self.text.insert(1.0, initial_value)
 
@@ -149,8 +404,7 @@ class FolderInputDialog:
         # Make it appear on top
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
         self.dialog.after(50, lambda: self.text.focus_set())
 
@@ -188,17 +442,12 @@ class GitCommitDialog:
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Select Git Commits to Push")
-        self.dialog.geometry("700x500")
 
         # Make modal
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        center_dialog(self.dialog, 700, 500)
 
         # Setup focus handling for macOS
         setup_dialog_focus(self.dialog)
@@ -231,9 +480,10 @@ class GitCommitDialog:
         scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=canvas.yview)
         self.commits_frame = ttk.Frame(canvas)
 
+        # Scroll region follows the frame's own size (no bbox walk over children)
         self.commits_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=self.commits_frame, anchor="nw")
@@ -284,8 +534,7 @@ class GitCommitDialog:
         # Make it appear on top
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
 
     def select_all(self):
@@ -333,47 +582,107 @@ class MainWindow:
         self.root.title("WordPress Deployment Tool")
         self.root.geometry("1100x700")  # Reduced height for better screen fit
 
-        # Set window icon
-        try:
-            icon_path = Path(__file__).parent.parent.parent / 'assets' / 'WPSyncopath.png'
-            if icon_path.exists():
-                icon = tk.PhotoImage(file=str(icon_path))
-                self.root.iconphoto(True, icon)
-        except Exception as e:
-            pass  # Silently fail if icon not found
-
-        # Apply Sun Valley theme - auto-detects system dark/light mode
-        sv_ttk.set_theme("dark")  # or "light" - will auto-detect system preference
-
         # Initialize services
         self.config_service = ConfigService()
-        self.push_controller = PushController(self.config_service)
-        self.pull_controller = PullController(self.config_service)
-        self.db_push_controller = DBPushController(self.config_service)
-        self.db_pull_controller = DBPullController(self.config_service)
+        # One pool of idle SFTP connections shared by every controller
+        self.sftp_pool = SFTPPool()
+        # Controllers are created on first use (see the properties below)
+        self._push_controller = None
+        self._pull_controller = None
+        self._db_push_controller = None
+        self._db_pull_controller = None
+        # Controllers are first read from worker threads; guards their lazy creation
+        self._controller_lock = Lock()
+
+        # Shared worker threads for blocking I/O triggered from the UI
+        self.worker = BackgroundWorker()
+        # Progress text from workers reaches the status labels through one UI tick
+        self.status_pump = StatusPump(self.root)
+
+        # Sites from the last refresh_sites, keyed by ID (avoids re-reading sites.yaml)
+        self._sites_by_id = {}
+        self._site_rows = {}
+        self._connection_progress = None
+        self._connection_test_running = False
+        self._toasts = []
+        self._include_paths = None
+
+        # Show a placeholder right away; theme and widgets are built once idle
+        self.loading_label = ttk.Label(self.root, text="Loading…")
+        self.loading_label.pack(expand=True)
+        self.root.after_idle(self._finish_init)
+
+    @property
+    def push_controller(self):
+        """Push controller, imported and created on first use (pulls in GitPython)"""
+        with self._controller_lock:
+            if self._push_controller is None:
+                from ..controllers.push_controller import PushController
+                self._push_controller = PushController(self.config_service, self.sftp_pool)
+        return self._push_controller
+
+    @property
+    def pull_controller(self):
+        """Pull controller, imported and created on first use"""
+        with self._controller_lock:
+            if self._pull_controller is None:
+                from ..controllers.pull_controller import PullController
+                self._pull_controller = PullController(self.config_service, self.sftp_pool)
+        return self._pull_controller
+
+    @property
+    def db_push_controller(self):
+        """Database push controller, imported and created on first use"""
+        with self._controller_lock:
+            if self._db_push_controller is None:
+                from ..controllers.db_push_controller import DBPushController
+                self._db_push_controller = DBPushController(self.config_service, self.sftp_pool)
+        return self._db_push_controller
+
+    @property
+    def db_pull_controller(self):
+        """Database pull controller, imported and created on first use"""
+        with self._controller_lock:
+            if self._db_pull_controller is None:
+                from ..controllers.db_pull_controller import DBPullController
+                self._db_pull_controller = DBPullController(self.config_service, self.sftp_pool)
+        return self._db_pull_controller
+
+    def _finish_init(self):
+        """Apply the theme and build the UI (deferred until the event loop is idle)"""
+        # Apply Sun Valley theme - auto-detects system dark/light mode
+        sv_ttk.set_theme("dark")  # or "light" - will auto-detect system preference
 
-        # Site display name to ID mapping for comboboxes
-        self.site_display_to_id = {}
+        self.loading_label.destroy()
 
         # Create UI
         self.create_widgets()
         self.refresh_sites()
 
+        # Decode the window icon once the UI is interactive
+        self.root.after(50, self._load_icon)
+
         # Log startup
-        import logging
-        logger = logging.getLogger('wp-deploy')
         logger.info("Application started with Sun Valley theme")
 
-        # macOS focus fix - activate the app properly
-        self.setup_macos_focus_fix()
+        # macOS focus fix - activate the app properly (PyObjC import deferred until the window is drawn)
+        if _IS_DARWIN:
+            self.root.after_idle(self.setup_macos_focus_fix)
+
+    def _load_icon(self):
+        """Set the window icon (the decoded image is kept at module level so Tk doesn't lose it)"""
+        global _icon
+        try:
+            if _icon is None and _ICON_PATH.exists():
+                _icon = tk.PhotoImage(file=str(_ICON_PATH))
+            if _icon is not None:
+                self.root.iconphoto(True, _icon)
+        except Exception:
+            pass  # Silently fail if icon not found
 
     def setup_macos_focus_fix(self):
         """Setup macOS-specific focus handling to fix first-click issue"""
-        import platform
-        import logging
-        logger = logging.getLogger('wp-deploy')
-
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_DARWIN:  # macOS
             # Try PyObjC approach for proper app activation
             try:
                 from AppKit import NSApp, NSApplication, NSApplicationActivationPolicyRegular
@@ -399,8 +708,12 @@ class MainWindow:
                 self.root.after(150, activate_app)
 
                 # Handle mouse entering window - activate app if not already active
+                # Bindings on the root also fire for every child widget (bindtags), so
+                # the handlers below ignore events that aren't for the window itself
                 def on_enter(event):
                     """Activate app when mouse enters window"""
+                    if event.widget is not self.root:
+                        return
                     try:
                         if not NSApp.isActive():
                             NSApp.activateIgnoringOtherApps_(True)
@@ -429,6 +742,8 @@ class MainWindow:
                 # Use FocusIn event to ensure proper activation
                 def on_focus_in(event):
                     """Ensure app is active when window gets focus"""
+                    if event.widget is not self.root:
+                        return
                     try:
                         if not NSApp.isActive():
                             NSApp.activateIgnoringOtherApps_(True)
@@ -438,8 +753,15 @@ class MainWindow:
                 self.root.bind('<FocusIn>', on_focus_in, add='+')
 
                 # Handle Visibility/Map events for when window becomes visible
+                last_activation = 0.0
+
                 def on_visibility(event):
                     """Activate app when window becomes visible"""
+                    nonlocal last_activation
+                    now = time.monotonic()
+                    if event.widget is not self.root or now - last_activation < FOCUS_DEBOUNCE:
+                        return
+                    last_activation = now
                     try:
                         NSApp.activateIgnoringOtherApps_(True)
                     except:
@@ -454,39 +776,20 @@ class MainWindow:
                 # PyObjC not available, use fallback approach
                 logger.warning("PyObjC not available - install pyobjc-framework-Cocoa for better macOS support")
 
-                # Fallback: Use osascript to activate
-                def activate_with_osascript():
-                    try:
-                        import subprocess
-                        subprocess.run([
-                            'osascript', '-e',
-                            f'tell application "System Events" to set frontmost of first process whose unix id is {os.getpid()} to true'
-                        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
-                    except:
-                        pass
-
-                # Activate now and after delay
-                self.root.after(50, activate_with_osascript)
-                self.root.after(200, activate_with_osascript)
-
-                # Bring window to front
-                self.root.lift()
-                self.root.attributes('-topmost', True)
-                self.root.after(100, lambda: self.root.attributes('-topmost', False))
-                self.root.focus_force()
-
-                # Bind click to activate
-                def on_click(event):
-                    activate_with_osascript()
-                    self.root.focus_force()
-
-                self.root.bind('<Button-1>', on_click, add='+')
+                # Fallback: bring the window to front with Tk alone once the event loop is running
+                self.root.after(0, self._raise_window)
 
             except Exception as e:
                 logger.error(f"Error applying macOS focus fix: {e}")
                 # Fall back to basic approach
-                self.root.lift()
-                self.root.focus_force()
+                self.root.after(0, self._raise_window)
+
+    def _raise_window(self):
+        """Bring the main window to the front, briefly keeping it on top"""
+        self.root.lift()
+        self.root.attributes('-topmost', True)
+        self.root.after(100, lambda: self.root.attributes('-topmost', False))
+        self.root.focus_force()
 
     def create_widgets(self):
         """Create all UI widgets"""
@@ -546,12 +849,11 @@ class MainWindow:
         preview_frame = ttk.LabelFrame(self.push_frame, text="Files to Push", padding=10)
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        preview_btn = ttk.Button(preview_frame, text="👁️ Preview Files", command=self.preview_push,
-                                style="Accent.TButton")
-        preview_btn.pack(pady=5, ipady=8, ipadx=15)
+        self.push_preview_btn = ttk.Button(preview_frame, text="👁️ Preview Files", command=self.preview_push,
+                                           style="Accent.TButton")
+        self.push_preview_btn.pack(pady=5, ipady=8, ipadx=15)
 
-        self.push_preview_text = scrolledtext.ScrolledText(preview_frame, height=10, width=80)
-        self.push_preview_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.push_preview_list = self.create_preview_list(preview_frame, height=10)
 
         # Action buttons
         button_frame = ttk.Frame(self.push_frame)
@@ -561,6 +863,14 @@ class MainWindow:
                                       style="Accent.TButton")
         self.push_files_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
 
+        # Popup menu for the push button (built once, posted on demand)
+        self.push_files_menu = tk.Menu(self.root, tearoff=0)
+        self.push_files_menu.add_command(label="▲ Push Updated Git Files", command=self.do_push)
+        self.push_files_menu.add_command(label="▲ Push All Files", command=self.do_push_all)
+        self.push_files_menu.add_command(label="📋 Push Files from Git Commits...", command=self.do_push_from_git)
+        self.push_files_menu.add_separator()
+        self.push_files_menu.add_command(label="📦 Push Folder(s)", command=self.do_push_folders)
+
         self.db_push_button = ttk.Button(button_frame, text="🗄️ PUSH DATABASE", command=self.do_db_push,
                                          style="Accent.TButton")
         self.db_push_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
@@ -570,7 +880,9 @@ class MainWindow:
         self.push_entire_site_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
 
         # Status
-        self.push_status = ttk.Label(self.push_frame, text="Ready", relief=tk.SUNKEN)
+        # Status text goes through a variable; Tk repaints once per idle cycle however often it's set
+        self.push_status_var = tk.StringVar(value="Ready")
+        self.push_status = ttk.Label(self.push_frame, textvariable=self.push_status_var, relief=tk.SUNKEN)
         self.push_status.pack(fill=tk.X, padx=10, pady=5)
 
     def setup_pull_tab(self):
@@ -594,19 +906,18 @@ class MainWindow:
         # Date range (initially hidden)
         self.date_frame = ttk.LabelFrame(self.pull_frame, text="Date Range", padding=10)
 
+        # Default to the last 7 days
+        now = datetime.now()
+        self.start_date_var = tk.StringVar(value=(now - timedelta(days=7)).strftime("%Y-%m-%d"))
+        self.end_date_var = tk.StringVar(value=now.strftime("%Y-%m-%d"))
+
         ttk.Label(self.date_frame, text="Start Date (YYYY-MM-DD):").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.start_date_entry = ttk.Entry(self.date_frame, width=20)
+        self.start_date_entry = ttk.Entry(self.date_frame, width=20, textvariable=self.start_date_var)
         self.start_date_entry.grid(row=0, column=1, sticky=tk.W, pady=5, padx=5)
-        # Default to 7 days ago
-        default_start = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        self.start_date_entry.insert(0, default_start)
 
         ttk.Label(self.date_frame, text="End Date (YYYY-MM-DD):").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.end_date_entry = ttk.Entry(self.date_frame, width=20)
+        self.end_date_entry = ttk.Entry(self.date_frame, width=20, textvariable=self.end_date_var)
         self.end_date_entry.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
-        # Default to today
-        default_end = datetime.now().strftime("%Y-%m-%d")
-        self.end_date_entry.insert(0, default_end)
 
         # Quick date buttons
         quick_frame = ttk.Frame(self.date_frame)
@@ -624,12 +935,11 @@ class MainWindow:
         # Preview frame (initially hidden)
         self.preview_frame = ttk.LabelFrame(self.pull_frame, text="Files to Pull", padding=10)
 
-        preview_pull_btn = ttk.Button(self.preview_frame, text="👁️ Preview Files", command=self.preview_pull,
-                                     style="Accent.TButton")
-        preview_pull_btn.pack(pady=5, ipady=8, ipadx=15)
+        self.pull_preview_btn = ttk.Button(self.preview_frame, text="👁️ Preview Files", command=self.preview_pull,
+                                           style="Accent.TButton")
+        self.pull_preview_btn.pack(pady=5, ipady=8, ipadx=15)
 
-        self.pull_preview_text = scrolledtext.ScrolledText(self.preview_frame, height=8, width=80)
-        self.pull_preview_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.pull_preview_list = self.create_preview_list(self.preview_frame, height=8)
 
         # Action buttons
         button_frame = ttk.Frame(self.pull_frame)
@@ -639,6 +949,11 @@ class MainWindow:
                                       style="Accent.TButton")
         self.pull_files_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
 
+        # Popup menu for the pull button (built once, posted on demand)
+        self.pull_files_menu = tk.Menu(self.root, tearoff=0)
+        self.pull_files_menu.add_command(label="▼ Pull Files by Date", command=self.do_pull_by_date)
+        self.pull_files_menu.add_command(label="📦 Pull Files by Folder", command=self.do_pull_folders)
+
         self.db_pull_button = ttk.Button(button_frame, text="🗄️ PULL DATABASE", command=self.do_db_pull,
                                          style="Accent.TButton")
         self.db_pull_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
@@ -648,33 +963,39 @@ class MainWindow:
         self.pull_entire_site_button.pack(side=tk.LEFT, padx=5, ipady=12, ipadx=25)
 
         # Status
-        self.pull_status = ttk.Label(self.pull_frame, text="Ready", relief=tk.SUNKEN)
+        self.pull_status_var = tk.StringVar(value="Ready")
+        self.pull_status = ttk.Label(self.pull_frame, textvariable=self.pull_status_var, relief=tk.SUNKEN)
         self.pull_status.pack(fill=tk.X, padx=10, pady=5)
 
     def setup_config_tab(self):
         """Setup configuration tab"""
-        # Site list with radio buttons
+        # Site list
         list_frame = ttk.LabelFrame(self.config_frame, text="Sites", padding=10)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Create a canvas with scrollbar for sites
-        canvas = tk.Canvas(list_frame, bg='#1e1e1e', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
-        self.sites_scroll_frame = ttk.Frame(canvas)
-
-        self.sites_scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=self.sites_scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Native tree view: one widget for all rows, scrolled and drawn by Tk
+        self.sites_tree = ttk.Treeview(list_frame, columns=("host", "url", "local_url"),
+                                       show="tree headings", selectmode="browse")
+        self.sites_tree.heading("#0", text="Site")
+        self.sites_tree.heading("host", text="Remote Host")
+        self.sites_tree.heading("url", text="🌐 Remote URL")
+        self.sites_tree.heading("local_url", text="💻 Local URL")
+        self.sites_tree.column("#0", width=220)
+        self.sites_tree.column("host", width=200)
+        self.sites_tree.column("url", width=240)
+        self.sites_tree.column("local_url", width=240)
+
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.sites_tree.yview)
+        self.sites_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.sites_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        self.sites_tree.bind('<<TreeviewSelect>>', self.on_site_tree_select)
+        # Double-click a URL cell to open it in the browser
+        self.sites_tree.bind('<Double-1>', self.on_site_tree_double_click)
+
         self.selected_site_var = tk.StringVar()
-        self.site_radiobuttons = []
 
         # Buttons
         button_frame = ttk.Frame(self.config_frame)
@@ -702,81 +1023,98 @@ class MainWindow:
         import_btn = ttk.Button(button_frame, text="📥 Import Site", command=self.import_site)
         import_btn.pack(side=tk.LEFT, padx=5, ipady=8, ipadx=12)
 
-    def refresh_sites(self):
-        """Refresh site list in all dropdowns and radio buttons"""
+    def refresh_sites(self, select_id=None):
+        """Reload sites from the config file off the UI thread, then update the list"""
+        def load_sites():
+            sites = self.config_service.get_all_sites()
+            self.root.after(0, self._apply_sites, sites, select_id)
+
+        self.worker.submit(load_sites)
+
+    def _apply_sites(self, sites, select_id=None):
+        """Show loaded sites in the list and restore the selection"""
         # Remember the currently selected site before refreshing
-        previously_selected_id = self.selected_site_var.get()
-
-        sites = self.config_service.get_all_sites()
-
-        # Clear existing radio buttons
-        for widget in self.sites_scroll_frame.winfo_children():
-            widget.destroy()
-        self.site_radiobuttons = []
-
-        # Create radio buttons for each site
-        for i, site in enumerate(sites):
-            # Frame for each site entry
-            site_frame = ttk.Frame(self.sites_scroll_frame)
-            site_frame.pack(fill=tk.X, padx=5, pady=3)
-
-            # Radio button with site name and host
-            rb = ttk.Radiobutton(
-                site_frame,
-                text=f"{site.name} - {site.remote_host}",
-                variable=self.selected_site_var,
-                value=site.id,
-                style="TRadiobutton",
-                command=self.on_site_selected
-            )
-            rb.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-            # Preview buttons
-            # Remote preview button if URL is set
-            if site.site_url:
-                preview_btn = ttk.Button(
-                    site_frame,
-                    text="🌐 Remote",
-                    command=lambda url=site.site_url: self.open_site_url(url),
-                    width=10
-                )
-                preview_btn.pack(side=tk.RIGHT, padx=2)
-
-            # Local preview button if local URL is set
-            local_url = None
-            if site.database_config and site.database_config.local_url:
-                local_url = site.database_config.local_url
-
-            if local_url:
-                local_preview_btn = ttk.Button(
-                    site_frame,
-                    text="💻 Local",
-                    command=lambda url=local_url: self.open_site_url(url),
-                    width=10
-                )
-                local_preview_btn.pack(side=tk.RIGHT, padx=2)
+        previously_selected_id = select_id or self.selected_site_var.get()
+
+        self._sites_by_id = {site.id: site for site in sites}
 
-            self.site_radiobuttons.append(rb)
+        # Update the tree in place, only touching rows whose text actually changed
+        rows = {site.id: self._site_row(site) for site in sites}
+
+        removed_ids = [site_id for site_id in self._site_rows if site_id not in rows]
+        if removed_ids:
+            self.sites_tree.delete(*removed_ids)
+
+        for index, (site_id, row) in enumerate(rows.items()):
+            cached = self._site_rows.get(site_id)
+            if cached is None:
+                self.sites_tree.insert("", index, iid=site_id, text=row[0], values=row[1])
+            elif cached != row:
+                self.sites_tree.item(site_id, text=row[0], values=row[1])
+
+        site_ids = tuple(rows)
+        if self.sites_tree.get_children() != site_ids:
+            for index, site_id in enumerate(site_ids):
+                self.sites_tree.move(site_id, "", index)
+        self._site_rows = rows
 
         # Restore previous selection if it still exists, otherwise select first site
         if sites:
-            # Check if previously selected site still exists
-            site_ids = [site.id for site in sites]
-            if previously_selected_id and previously_selected_id in site_ids:
-                # Restore previous selection
-                self.selected_site_var.set(previously_selected_id)
+            if previously_selected_id in rows:
+                self.select_site(previously_selected_id)
             else:
-                # Select first site if no valid previous selection
-                self.selected_site_var.set(sites[0].id)
+                self.select_site(sites[0].id)
+
+    def _site_row(self, site):
+        """Render the (text, values) shown for a site in the list"""
+        local_url = site.database_config.local_url if site.database_config else ""
+        return site.name, (site.remote_host, site.site_url or "", local_url or "")
+
+    def update_site_row(self, site):
+        """Insert or update a single site in the list without reloading every site"""
+        self._sites_by_id[site.id] = site
+        row = self._site_row(site)
+        cached = self._site_rows.get(site.id)
+        if cached is None:
+            self.sites_tree.insert("", tk.END, iid=site.id, text=row[0], values=row[1])
+        elif cached != row:
+            self.sites_tree.item(site.id, text=row[0], values=row[1])
+        self._site_rows[site.id] = row
+        self.select_site(site.id)
+
+    def select_site(self, site_id):
+        """Select a site in the list and update all tabs"""
+        self.selected_site_var.set(site_id)
+        self.sites_tree.selection_set(site_id)
+        self.sites_tree.focus(site_id)
+        self.sites_tree.see(site_id)
+        self.on_site_selected()
+
+    def on_site_tree_select(self, event):
+        """Handle selection changes made in the site list"""
+        selection = self.sites_tree.selection()
+        if selection and selection[0] != self.selected_site_var.get():
+            self.selected_site_var.set(selection[0])
             self.on_site_selected()
 
+    def on_site_tree_double_click(self, event):
+        """Open the remote/local URL when its cell is double-clicked"""
+        row = self.sites_tree.identify_row(event.y)
+        column = self.sites_tree.identify_column(event.x)
+        if not row or column not in ('#2', '#3'):
+            return
+
+        url = self.sites_tree.set(row, 'url' if column == '#2' else 'local_url')
+        if url:
+            self.open_site_url(url)
+
     def on_site_selected(self):
         """Handle site selection - update all tabs"""
         site_id = self.selected_site_var.get()
         if not site_id:
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             return
 
@@ -788,22 +1126,103 @@ class MainWindow:
         self.pull_site_label.config(text=display_text)
 
         # Update push preview
-        self.push_preview_text.delete(1.0, tk.END)
-        self.push_preview_text.insert(1.0, f"Site: {site.name}\n")
-        self.push_preview_text.insert(tk.END, f"Local: {site.local_path}\n")
-        self.push_preview_text.insert(tk.END, f"Remote: {site.remote_host}:{site.remote_path}\n\n")
-        self.push_preview_text.insert(tk.END, "Click 'Preview Files' to see files that will be pushed.")
+        self.set_preview_lines(self.push_preview_list, [
+            f"Site: {site.name}",
+            f"Local: {site.local_path}",
+            f"Remote: {site.remote_host}:{site.remote_path}",
+            "",
+            "Click 'Preview Files' to see files that will be pushed."
+        ])
 
     def set_date_range(self, days):
         """Set date range to last N days"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        self.start_date_entry.delete(0, tk.END)
-        self.start_date_entry.insert(0, start_date.strftime("%Y-%m-%d"))
+        self.start_date_var.set(start_date.strftime("%Y-%m-%d"))
+        self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
+
+    def show_toast(self, title, message, level='info'):
+        """
+        Show a result from a background job in a small non-modal popup
+
+        Unlike a messagebox this doesn't block the event loop, so progress from other
+        jobs keeps flowing while it's up. Toasts stack upwards from the bottom-right
+        corner of the main window and close after a few seconds or when clicked.
 
-        self.end_date_entry.delete(0, tk.END)
-        self.end_date_entry.insert(0, end_date.strftime("%Y-%m-%d"))
+        Args:
+            title: Popup title
+            message: Popup message
+            level: 'info' or 'error'
+        """
+        top = tk.Toplevel(self.root)
+        top.withdraw()
+        top.overrideredirect(True)
+        top.attributes('-topmost', True)
+
+        frame = ttk.Frame(top, padding=12, relief=tk.SOLID, borderwidth=1)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=title, font=("", 12, "bold"),
+                  foreground="red" if level == 'error' else "green").pack(anchor=tk.W)
+        ttk.Label(frame, text=message, wraplength=360, justify=tk.LEFT).pack(anchor=tk.W, pady=(4, 0))
+
+        duration = TOAST_ERROR_MS if level == 'error' else TOAST_MS
+        timer = None
+
+        def close(event=None):
+            if timer:
+                self.root.after_cancel(timer)
+            if top in self._toasts:
+                self._toasts.remove(top)
+            top.destroy()
+
+        def hold(event=None):
+            nonlocal timer
+            if timer:
+                self.root.after_cancel(timer)
+            timer = None
+
+        def resume(event=None):
+            nonlocal timer
+            hold()
+            timer = self.root.after(duration, close)
+
+        # Bindings on the toplevel also fire for its child widgets;
+        # the timer is paused while the pointer is over the toast
+        top.bind('<Button-1>', close)
+        top.bind('<Enter>', hold)
+        top.bind('<Leave>', resume)
+
+        # Place above any toasts already showing
+        top.update_idletasks()
+        margin = 16
+        x = self.root.winfo_rootx() + self.root.winfo_width() - top.winfo_reqwidth() - margin
+        y = self.root.winfo_rooty() + self.root.winfo_height() - margin
+        y -= sum(t.winfo_reqheight() + margin // 2 for t in self._toasts) + top.winfo_reqheight()
+        top.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        top.deiconify()
+
+        self._toasts.append(top)
+        resume()
+
+    def create_preview_list(self, parent, height):
+        """Create a scrollable preview list (a Listbox only lays out the visible rows)"""
+        list_frame = ttk.Frame(parent)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        listbox = tk.Listbox(list_frame, height=height, width=80, activestyle='none')
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return listbox
+
+    def set_preview_lines(self, listbox, lines):
+        """Replace the contents of a preview list in one delete + insert"""
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *lines)
+        listbox.yview_moveto(0)
 
     def preview_push(self):
         """Preview files that will be pushed"""
@@ -812,27 +1231,35 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site")
             return
 
-        self.push_preview_text.delete(1.0, tk.END)
-        self.push_preview_text.insert(1.0, "Loading...\n")
+        # Disabled until the preview arrives, so repeated clicks don't queue duplicate scans
+        self.push_preview_btn.config(state=tk.DISABLED)
+        self.push_status_var.set("Loading preview...")
 
         def preview_thread():
-            success, message, files = self.push_controller.get_files_to_push(site_id)
+            lines = []
+            try:
+                success, message, files = self.push_controller.get_files_to_push(site_id)
 
-            def update_ui():
-                self.push_preview_text.delete(1.0, tk.END)
+                # Build the lines here so the UI thread only hands them to Tk
                 if success:
-                    self.push_preview_text.insert(1.0, f"{message}\n\n")
-                    if files:
-                        for file in files:
-                            self.push_preview_text.insert(tk.END, f"{file}\n")
-                    else:
-                        self.push_preview_text.insert(tk.END, "No files to push.")
+                    body = format_preview_files(files, len(files)) if files else ["No files to push."]
+                    lines = [message, "", *body]
                 else:
-                    self.push_preview_text.insert(1.0, f"Error: {message}")
+                    lines = [f"Error: {message}"]
+            except Exception as e:
+                logger.error(f"Push preview failed: {e}")
+                lines = [f"Error: {e}"]
+            finally:
+                # Always re-enable the button, even if the preview blew up
+                def update_ui():
+                    self.push_status_var.set("Ready")
+                    self.push_preview_btn.config(state=tk.NORMAL)
+                    # Single insert - one Tcl call regardless of file count
+                    self.set_preview_lines(self.push_preview_list, lines)
 
-            self.root.after(0, update_ui)
+                self.root.after_idle(update_ui)
 
-        Thread(target=preview_thread, daemon=True).start()
+        self.worker.submit(preview_thread)
 
     def preview_pull(self):
         """Preview files that will be pulled"""
@@ -843,18 +1270,18 @@ class MainWindow:
 
         # Parse dates
         try:
-            start_date = datetime.strptime(self.start_date_entry.get().strip(), "%Y-%m-%d")
-            end_date = datetime.strptime(self.end_date_entry.get().strip(), "%Y-%m-%d")
+            start_date = parse_date(self.start_date_var.get().strip())
+            end_date = parse_date(self.end_date_var.get().strip())
         except ValueError:
             messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
             return
 
         # Get include paths
-        include_paths = [line.strip() for line in self.pull_paths_text.get(1.0, tk.END).split('\n') if line.strip()]
+        include_paths = self._parse_include_paths()
 
         if not include_paths:
             # Load from site config
-            site = self.config_service.get_site(site_id)
+            site = self._sites_by_id.get(site_id)
             if site and site.pull_include_paths:
                 include_paths = site.pull_include_paths
                 # Display them
@@ -864,27 +1291,46 @@ class MainWindow:
                 messagebox.showwarning("Warning", "Please specify include paths")
                 return
 
-        self.pull_preview_text.delete(1.0, tk.END)
-        self.pull_preview_text.insert(1.0, "Loading...\n")
+        # Disabled until the preview arrives, so repeated clicks don't queue duplicate scans
+        self.pull_preview_btn.config(state=tk.DISABLED)
+        self.pull_status_var.set("Loading preview...")
 
         def preview_thread():
-            success, message, files = self.pull_controller.get_files_to_pull(site_id, start_date, end_date, include_paths)
+            lines = []
+            try:
+                success, message, files = self.pull_controller.get_files_to_pull(site_id, start_date, end_date,
+                                                                                 include_paths)
 
-            def update_ui():
-                self.pull_preview_text.delete(1.0, tk.END)
+                # Build the lines here so the UI thread only hands them to Tk
                 if success:
-                    self.pull_preview_text.insert(1.0, f"{message}\n\n")
                     if files:
-                        for file_path, mod_date in files:
-                            self.pull_preview_text.insert(tk.END, f"{file_path}\n")
+                        body = format_preview_files((file_path for file_path, _mod_date in files), len(files))
                     else:
-                        self.pull_preview_text.insert(tk.END, "No files to pull.")
+                        body = ["No files to pull."]
+                    lines = [message, "", *body]
                 else:
-                    self.pull_preview_text.insert(1.0, f"Error: {message}")
+                    lines = [f"Error: {message}"]
+            except Exception as e:
+                logger.error(f"Pull preview failed: {e}")
+                lines = [f"Error: {e}"]
+            finally:
+                # Always re-enable the button, even if the preview blew up
+                def update_ui():
+                    self.pull_status_var.set("Ready")
+                    self.pull_preview_btn.config(state=tk.NORMAL)
+                    # Single insert - one Tcl call regardless of file count
+                    self.set_preview_lines(self.pull_preview_list, lines)
 
-            self.root.after(0, update_ui)
+                self.root.after_idle(update_ui)
+
+        self.worker.submit(preview_thread)
 
-        Thread(target=preview_thread, daemon=True).start()
+    def _parse_include_paths(self):
+        """Get the non-blank, stripped lines of the include paths box (re-read only after edits)"""
+        if self._include_paths is None or self.pull_paths_text.edit_modified():
+            self._include_paths = _PATH_RE.findall(self.pull_paths_text.get(1.0, tk.END))
+            self.pull_paths_text.edit_modified(False)
+        return self._include_paths
 
     def show_pull_files_menu(self):
         """Show menu with pull file options"""
@@ -893,10 +1339,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site from the Configuration tab")
             return
 
-        # Create a popup menu
-        menu = tk.Menu(self.root, tearoff=0)
-        menu.add_command(label="▼ Pull Files by Date", command=self.do_pull_by_date)
-        menu.add_command(label="📦 Pull Files by Folder", command=self.do_pull_folders)
+        menu = self.pull_files_menu
 
         # Get button position to display menu near it
         try:
@@ -909,6 +1352,10 @@ class MainWindow:
 
     def show_pull_date_ui(self):
         """Show date range and paths UI for pull by date"""
+        # Already shown - repacking would reflow the whole tab for nothing
+        if self.date_frame.winfo_manager():
+            return
+
         # Hide any existing frames first
         self.date_frame.pack_forget()
         self.paths_frame.pack_forget()
@@ -932,13 +1379,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site from the Configuration tab")
             return
 
-        # Create a popup menu
-        menu = tk.Menu(self.root, tearoff=0)
-        menu.add_command(label="▲ Push Updated Git Files", command=self.do_push)
-        menu.add_command(label="▲ Push All Files", command=self.do_push_all)
-        menu.add_command(label="📋 Push Files from Git Commits...", command=self.do_push_from_git)
-        menu.add_separator()
-        menu.add_command(label="📦 Push Folder(s)", command=self.do_push_folders)
+        menu = self.push_files_menu
 
         # Get button position to display menu near it
         try:
@@ -951,8 +1392,6 @@ class MainWindow:
 
     def do_push(self):
         """Execute push operation"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
 
         logger.info("=== PUSH OPERATION STARTED ===")
 
@@ -962,7 +1401,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         logger.info(f"Selected site: {site.name} ({site_id})")
         logger.info(f"Local path: {site.local_path}")
         logger.info(f"Remote: {site.remote_host}:{site.remote_path}")
@@ -973,41 +1412,41 @@ class MainWindow:
 
         # Visual feedback - button clicked
         self.push_files_button.config(state=tk.DISABLED, text="⏳ PUSHING...")
-        self.push_status.config(text="Initializing push...")
+        self.push_status_var.set("Initializing push...")
         logger.info("Starting push operation...")
 
         def push_thread():
+            progress_log = ProgressLog("Push progress")
+            status = ThrottledStatus(self.status_pump, self.push_status_var, "Pushing: {}/{} - {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Pushing: {current}/{total} - {message}"
-                self.root.after(0, lambda: self.push_status.config(text=status_text))
-                logger.info(f"Progress: {current}/{total} - {message}")
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.push_controller.push(site_id, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.push_files_button.config(state=tk.NORMAL, text="▲ PUSH FILES")
-                self.push_status.config(text=message)
+                self.push_status_var.set(message)
 
                 if success:
                     logger.info(f"✓ Push completed successfully: {stats['files_pushed']} files")
-                    result = f"Push completed!\n\n"
-                    result += f"Files pushed: {stats['files_pushed']}\n"
-                    result += f"Bytes transferred: {stats['bytes_transferred']}\n"
+                    result = _PUSH_RESULT.format_map(stats)
                     if stats['files_failed'] > 0:
-                        result += f"Files failed: {stats['files_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                        result += _FILES_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
                     logger.error(f"✗ Push failed: {message}")
-                    messagebox.showerror("Error", message)
+                    self.show_toast("Error", message, level='error')
 
-            self.root.after(0, update_ui)
+            self.root.after_idle(update_ui)
 
-        Thread(target=push_thread, daemon=True).start()
+        self.worker.submit(push_thread)
 
     def do_push_all(self):
         """Execute push ALL files operation"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
 
         logger.info("=== PUSH ALL OPERATION STARTED ===")
 
@@ -1017,7 +1456,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         logger.info(f"Selected site: {site.name} ({site_id})")
         logger.info(f"Local path: {site.local_path}")
         logger.info(f"Remote: {site.remote_host}:{site.remote_path}")
@@ -1028,41 +1467,41 @@ class MainWindow:
 
         # Visual feedback - button clicked
         self.push_files_button.config(state=tk.DISABLED, text="⏳ PUSHING ALL...")
-        self.push_status.config(text="Initializing push all...")
+        self.push_status_var.set("Initializing push all...")
         logger.info("Starting push all operation...")
 
         def push_all_thread():
+            progress_log = ProgressLog("Push progress")
+            status = ThrottledStatus(self.status_pump, self.push_status_var, "Pushing: {}/{} - {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Pushing: {current}/{total} - {message}"
-                self.root.after(0, lambda: self.push_status.config(text=status_text))
-                logger.info(f"Progress: {current}/{total} - {message}")
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.push_controller.push_all(site_id, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.push_files_button.config(state=tk.NORMAL, text="▲ PUSH FILES")
-                self.push_status.config(text=message)
+                self.push_status_var.set(message)
 
                 if success:
                     logger.info(f"✓ Push all completed successfully: {stats['files_pushed']} files")
-                    result = f"Push All completed!\n\n"
-                    result += f"Files pushed: {stats['files_pushed']}\n"
-                    result += f"Bytes transferred: {stats['bytes_transferred']}\n"
+                    result = _PUSH_ALL_RESULT.format_map(stats)
                     if stats['files_failed'] > 0:
-                        result += f"Files failed: {stats['files_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                        result += _FILES_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
                     logger.error(f"✗ Push all failed: {message}")
-                    messagebox.showerror("Error", message)
+                    self.show_toast("Error", message, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=push_all_thread, daemon=True).start()
+        self.worker.submit(push_all_thread)
 
     def do_push_from_git(self):
         """Push files from selected git commits"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
 
         logger.info("=== PUSH FROM GIT COMMITS OPERATION STARTED ===")
 
@@ -1072,7 +1511,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
@@ -1136,37 +1575,38 @@ class MainWindow:
 
         # Visual feedback - button clicked
         self.push_files_button.config(state=tk.DISABLED, text="⏳ PUSHING...")
-        self.push_status.config(text="Pushing files from commits...")
+        self.push_status_var.set("Pushing files from commits...")
         logger.info("Starting push from commits operation...")
 
         def push_from_git_thread():
+            progress_log = ProgressLog("Push progress")
+            status = ThrottledStatus(self.status_pump, self.push_status_var, "Pushing: {}/{} - {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Pushing: {current}/{total} - {message}"
-                self.root.after(0, lambda: self.push_status.config(text=status_text))
-                logger.info(f"Progress: {current}/{total} - {message}")
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.push_controller.push_from_commits(site_id, selected_hashes, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.push_files_button.config(state=tk.NORMAL, text="▲ PUSH FILES")
-                self.push_status.config(text=message)
+                self.push_status_var.set(message)
 
                 if success:
                     logger.info(f"Push from commits completed successfully: {stats['files_pushed']} files")
-                    result = f"Push from commits completed!\n\n"
-                    result += f"Commits processed: {stats.get('commits_pushed', len(selected_hashes))}\n"
-                    result += f"Files pushed: {stats['files_pushed']}\n"
-                    result += f"Bytes transferred: {stats['bytes_transferred']:,}\n"
+                    result = _PUSH_COMMITS_RESULT.format_map({'commits_pushed': len(selected_hashes), **stats})
                     if stats['files_failed'] > 0:
-                        result += f"Files failed: {stats['files_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                        result += _FILES_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
                     logger.error(f"Push from commits failed: {message}")
-                    messagebox.showerror("Error", message)
+                    self.show_toast("Error", message, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=push_from_git_thread, daemon=True).start()
+        self.worker.submit(push_from_git_thread)
 
     def do_pull_by_date(self):
         """Execute pull by date operation - shows date UI first"""
@@ -1190,17 +1630,17 @@ class MainWindow:
 
         # Parse dates
         try:
-            start_date = datetime.strptime(self.start_date_entry.get().strip(), "%Y-%m-%d")
-            end_date = datetime.strptime(self.end_date_entry.get().strip(), "%Y-%m-%d")
+            start_date = parse_date(self.start_date_var.get().strip())
+            end_date = parse_date(self.end_date_var.get().strip())
         except ValueError:
             messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
             return
 
         # Get include paths
-        include_paths = [line.strip() for line in self.pull_paths_text.get(1.0, tk.END).split('\n') if line.strip()]
+        include_paths = self._parse_include_paths()
 
         if not include_paths:
-            site = self.config_service.get_site(site_id)
+            site = self._sites_by_id.get(site_id)
             if site and site.pull_include_paths:
                 include_paths = site.pull_include_paths
             else:
@@ -1211,37 +1651,38 @@ class MainWindow:
             return
 
         self.pull_files_button.config(state=tk.DISABLED, text="⏳ PULLING...")
-        self.pull_status.config(text="Pulling...")
+        self.pull_status_var.set("Pulling...")
 
         def pull_thread():
+            progress_log = ProgressLog("Pull progress")
+            status = ThrottledStatus(self.status_pump, self.pull_status_var, "Pulling: {}/{} - {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Pulling: {current}/{total} - {message}"
-                self.root.after(0, lambda: self.pull_status.config(text=status_text))
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.pull_controller.pull(site_id, start_date, end_date, include_paths, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.pull_files_button.config(state=tk.NORMAL, text="▼ PULL FILES")
-                self.pull_status.config(text=message)
+                self.pull_status_var.set(message)
 
                 if success:
-                    result = f"Pull completed!\n\n"
-                    result += f"Files pulled: {stats['files_pulled']}\n"
-                    result += f"Bytes transferred: {stats['bytes_transferred']}\n"
+                    result = _PULL_RESULT.format_map(stats)
                     if stats['files_failed'] > 0:
-                        result += f"Files failed: {stats['files_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                        result += _FILES_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
-                    messagebox.showerror("Error", message)
+                    self.show_toast("Error", message, level='error')
 
-            self.root.after(0, update_ui)
+            self.root.after_idle(update_ui)
 
-        Thread(target=pull_thread, daemon=True).start()
+        self.worker.submit(pull_thread)
 
     def do_pull_folders(self):
         """Pull specific folders using compression"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
 
         logger.info("=== PULL FOLDERS OPERATION STARTED ===")
 
@@ -1250,7 +1691,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
@@ -1292,44 +1733,44 @@ class MainWindow:
 
         # Disable button during operation
         self.pull_files_button.config(state=tk.DISABLED, text="⏳ PULLING FOLDERS...")
-        self.pull_status.config(text="Pulling folders...")
+        self.pull_status_var.set("Pulling folders...")
 
         def pull_thread():
+            progress_log = ProgressLog("Pull folders progress")
+            status = ThrottledStatus(self.status_pump, self.pull_status_var, "Folders done {}/{}: {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Folder {current}/{total}: {message}"
-                self.root.after(0, lambda: self.pull_status.config(text=status_text))
-                logger.info(f"Progress: Folder {current}/{total} - {message}")
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.pull_controller.pull_folders(site_id, folders, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.pull_files_button.config(state=tk.NORMAL, text="▼ PULL FILES")
                 if success:
-                    self.pull_status.config(text=f"✓ {message}")
+                    self.pull_status_var.set(f"✓ {message}")
                     logger.info(f"Pull folders completed: {message}")
 
                     # Show detailed results
-                    result = f"Pull folders completed!\n\n"
-                    result += f"Folders pulled: {stats.get('folders_pulled', 0)}\n"
-                    result += f"Bytes transferred: {stats.get('bytes_transferred', 0):,}\n"
-                    if stats.get('folders_failed', 0) > 0:
-                        result += f"Folders failed: {stats['folders_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                    result = _PULL_FOLDERS_RESULT.format_map(stats)
+                    if stats['folders_failed'] > 0:
+                        result += _FOLDERS_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
-                    self.pull_status.config(text=f"✗ {message}")
+                    self.pull_status_var.set(f"✗ {message}")
                     logger.error(f"Pull folders failed: {message}")
-                    messagebox.showerror("Error", f"Pull folders failed:\n\n{message}")
+                    self.show_toast("Error", f"Pull folders failed:\n\n{message}", level='error')
 
                 self.refresh_sites()
 
             self.root.after(0, update_ui)
 
-        Thread(target=pull_thread, daemon=True).start()
+        self.worker.submit(pull_thread)
 
     def do_push_folders(self):
         """Push specific folders using compression"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
 
         logger.info("=== PUSH FOLDERS OPERATION STARTED ===")
 
@@ -1338,7 +1779,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
@@ -1380,39 +1821,41 @@ class MainWindow:
 
         # Disable button during operation
         self.push_files_button.config(state=tk.DISABLED, text="⏳ PUSHING FOLDERS...")
-        self.push_status.config(text="Pushing folders...")
+        self.push_status_var.set("Pushing folders...")
 
         def push_thread():
+            progress_log = ProgressLog("Push folders progress")
+            status = ThrottledStatus(self.status_pump, self.push_status_var, "Folders done {}/{}: {}")
+
             def progress_callback(current, total, message):
-                status_text = f"Folder {current}/{total}: {message}"
-                self.root.after(0, lambda: self.push_status.config(text=status_text))
-                logger.info(f"Progress: Folder {current}/{total} - {message}")
+                progress_log.record(current, total, message)
+                status.update(current, total, message)
 
             success, message, stats = self.push_controller.push_folders(site_id, folders, progress_callback)
+            progress_log.flush()
+            status.finish()
 
             def update_ui():
                 self.push_files_button.config(state=tk.NORMAL, text="▲ PUSH FILES")
                 if success:
-                    self.push_status.config(text=f"✓ {message}")
+                    self.push_status_var.set(f"✓ {message}")
                     logger.info(f"Push folders completed: {message}")
 
                     # Show detailed results
-                    result = f"Push folders completed!\n\n"
-                    result += f"Folders pushed: {stats.get('folders_pushed', 0)}\n"
-                    result += f"Bytes transferred: {stats.get('bytes_transferred', 0):,}\n"
-                    if stats.get('folders_failed', 0) > 0:
-                        result += f"Folders failed: {stats['folders_failed']}\n"
-                    messagebox.showinfo("Success", result)
+                    result = _PUSH_FOLDERS_RESULT.format_map(stats)
+                    if stats['folders_failed'] > 0:
+                        result += _FOLDERS_FAILED.format_map(stats)
+                    self.show_toast("Success", result)
                 else:
-                    self.push_status.config(text=f"✗ {message}")
+                    self.push_status_var.set(f"✗ {message}")
                     logger.error(f"Push folders failed: {message}")
-                    messagebox.showerror("Error", f"Push folders failed:\n\n{message}")
+                    self.show_toast("Error", f"Push folders failed:\n\n{message}", level='error')
 
                 self.refresh_sites()
 
             self.root.after(0, update_ui)
 
-        Thread(target=push_thread, daemon=True).start()
+        self.worker.submit(push_thread)
 
     def do_db_push(self):
         """Push database to remote"""
@@ -1422,7 +1865,10 @@ class MainWindow:
             messagebox.showwarning("No Selection", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
+        if not site:
+            messagebox.showerror("Error", "Selected site not found")
+            return
 
         # Check if database is configured
         if not site.database_config:
@@ -1448,7 +1894,7 @@ class MainWindow:
 
         # Disable button
         self.db_push_button.config(state=tk.DISABLED)
-        self.push_status.config(text="Pushing database...")
+        self.push_status_var.set("Pushing database...")
 
         # Show progress dialog
         progress = ProgressDialog(self.root, "Database Push", "Pushing database to remote server...")
@@ -1461,18 +1907,18 @@ class MainWindow:
                 self.db_push_button.config(state=tk.NORMAL)
 
                 if success:
-                    self.push_status.config(text=message)
-                    messagebox.showinfo("Success", f"{message}\n\n"
-                                                   f"Tables: {stats.get('tables_exported', 0)}\n"
-                                                   f"URLs Replaced: {stats.get('urls_replaced', 0)}\n"
-                                                   f"Backup: {stats.get('backup_created', 'None')}")
+                    self.push_status_var.set(message)
+                    self.show_toast("Success", f"{message}\n\n"
+                                    f"Tables: {stats.get('tables_exported', 0)}\n"
+                                    f"URLs Replaced: {stats.get('urls_replaced', 0)}\n"
+                                    f"Backup: {stats.get('backup_created', 'None')}")
                 else:
-                    self.push_status.config(text="Error")
-                    messagebox.showerror("Error", message)
+                    self.push_status_var.set("Error")
+                    self.show_toast("Error", message, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=db_push_thread, daemon=True).start()
+        self.worker.submit(db_push_thread)
 
     def do_db_pull(self):
         """Pull database from remote"""
@@ -1482,7 +1928,10 @@ class MainWindow:
             messagebox.showwarning("No Selection", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
+        if not site:
+            messagebox.showerror("Error", "Selected site not found")
+            return
 
         # Check if database is configured
         if not site.database_config:
@@ -1505,7 +1954,7 @@ class MainWindow:
 
         # Disable button
         self.db_pull_button.config(state=tk.DISABLED)
-        self.pull_status.config(text="Pulling database...")
+        self.pull_status_var.set("Pulling database...")
 
         # Show progress dialog
         progress = ProgressDialog(self.root, "Database Pull", "Pulling database from remote server...")
@@ -1518,38 +1967,35 @@ class MainWindow:
                 self.db_pull_button.config(state=tk.NORMAL)
 
                 if success:
-                    self.pull_status.config(text=message)
-                    messagebox.showinfo("Success", f"{message}\n\n"
-                                                   f"Tables: {stats.get('tables_exported', 0)}\n"
-                                                   f"URLs Replaced: {stats.get('urls_replaced', 0)}\n"
-                                                   f"Backup: {stats.get('backup_created', 'None')}")
+                    self.pull_status_var.set(message)
+                    self.show_toast("Success", f"{message}\n\n"
+                                    f"Tables: {stats.get('tables_exported', 0)}\n"
+                                    f"URLs Replaced: {stats.get('urls_replaced', 0)}\n"
+                                    f"Backup: {stats.get('backup_created', 'None')}")
                 else:
-                    self.pull_status.config(text="Error")
-                    messagebox.showerror("Error", message)
+                    self.pull_status_var.set("Error")
+                    self.show_toast("Error", message, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=db_pull_thread, daemon=True).start()
+        self.worker.submit(db_pull_thread)
 
     def add_site_dialog(self):
         """Show dialog to add new site"""
         from .site_dialog import SiteDialog
         dialog = SiteDialog(self.root, self.config_service)
         self.root.wait_window(dialog.dialog)
-        self.refresh_sites()
+        if dialog.saved_site:
+            self.update_site_row(dialog.saved_site)
 
     def open_site_url(self, url):
         """Open site URL in default browser"""
         import webbrowser
-        import logging
-        logger = logging.getLogger('wp-deploy')
         logger.info(f"Opening site URL: {url}")
         webbrowser.open(url)
 
     def edit_site_dialog(self):
         """Show dialog to edit selected site"""
-        import logging
-        logger = logging.getLogger('wp-deploy')
         logger.info("Edit Site button clicked")
 
         site_id = self.selected_site_var.get()
@@ -1558,7 +2004,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site to edit")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             logger.error(f"Site not found: {site_id}")
             messagebox.showerror("Error", "Selected site not found")
@@ -1569,9 +2015,15 @@ class MainWindow:
         from .site_dialog import SiteDialog
         dialog = SiteDialog(self.root, self.config_service, site)
         self.root.wait_window(dialog.dialog)
-        self.refresh_sites()
+        if dialog.saved_site:
+            self.invalidate_connections(site_id)
+            self.update_site_row(dialog.saved_site)
         logger.info("Site edit dialog closed")
 
+    def invalidate_connections(self, site_id):
+        """Drop cached SFTP connections for a site so the next operation reconnects"""
+        self.sftp_pool.invalidate(site_id)
+
     def delete_site(self):
         """Delete selected site"""
         site_id = self.selected_site_var.get()
@@ -1579,13 +2031,14 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site to delete")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
 
         if messagebox.askyesno("Confirm", f"Delete site '{site.name}'?"):
             self.config_service.delete_site(site.id)
+            self.invalidate_connections(site.id)
             self.refresh_sites()
             messagebox.showinfo("Success", "Site deleted")
 
@@ -1596,7 +2049,7 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site to export")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
@@ -1646,10 +2099,8 @@ class MainWindow:
 
         site = self.config_service.import_site_from_json(file_path)
         if site:
-            self.refresh_sites()
-            # Select the newly imported site
-            self.selected_site_var.set(site.id)
-            self.on_site_selected()
+            # Select the newly imported site once the list is reloaded
+            self.refresh_sites(select_id=site.id)
             messagebox.showinfo(
                 "Import Successful",
                 f"Site '{site.name}' has been imported successfully.\n\n"
@@ -1669,55 +2120,60 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select a site to test")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
         if not site:
             messagebox.showerror("Error", "Selected site not found")
             return
 
-        password = self.config_service.get_password(site.id)
-        if not password:
-            messagebox.showerror("Error", "Password not found in keyring")
+        # One test at a time; the dialog is shared, so a second test would close it under the first
+        if self._connection_test_running:
             return
+        self._connection_test_running = True
 
-        # Show progress dialog immediately
-        progress = ProgressDialog(
-            self.root,
-            "Testing Connection",
-            f"Connecting to {site.remote_host}...\nPlease wait..."
-        )
+        # Show progress dialog immediately, reusing the hidden one from earlier tests
+        message = f"Connecting to {site.remote_host}...\nPlease wait..."
+        progress = self._connection_progress
+        if progress and progress.dialog.winfo_exists():
+            progress.show("Testing Connection", message)
+        else:
+            progress = ProgressDialog(self.root, "Testing Connection", message, reusable=True)
+            self._connection_progress = progress
 
         def test_thread():
-            from ..services.sftp_service import SFTPService
-
-            def update_progress(msg):
-                self.root.after(0, lambda: progress.update_message(msg))
+            # Keyring lookups can block (e.g. keychain prompts), so do them off the UI thread
+            password = self.config_service.get_password(site.id)
+            if not password:
+                def show_missing_password():
+                    self._connection_test_running = False
+                    progress.close()
+                    self.show_toast("Error", "Password not found in keyring", level='error')
+                self.root.after(0, show_missing_password)
+                return
 
+            # Always test with a fresh handshake; a working connection is kept for the next operation
+            self.sftp_pool.invalidate(site.id)
             try:
-                update_progress(f"Connecting to {site.remote_host}:{site.remote_port}...")
-                sftp = SFTPService(site.remote_host, site.remote_port, site.remote_username, password)
-
-                update_progress("Authenticating...")
-                success, message = sftp.test_connection()
+                progress.post_message(f"Connecting to {site.remote_host}:{site.remote_port}...")
+                sftp = self.sftp_pool.acquire(site, password)
+                self.sftp_pool.release(site.id, sftp)
+                success, message = True, "Connection successful"
+            except Exception as e:
+                success, message = False, str(e)
 
-                def update_ui():
-                    progress.close()
-                    if success:
-                        messagebox.showinfo("Success", f"Connection successful!\n\nConnected to: {site.remote_host}")
-                    else:
-                        messagebox.showerror("Error", f"Connection failed:\n\n{message}")
+            def update_ui():
+                self._connection_test_running = False
+                progress.close()
+                if success:
+                    self.show_toast("Success", f"Connection successful!\n\nConnected to: {site.remote_host}")
+                else:
+                    self.show_toast("Error", f"Connection failed:\n\n{message}", level='error')
 
-                self.root.after(0, update_ui)
-            except Exception as e:
-                def update_ui():
-                    progress.close()
-                    messagebox.showerror("Error", f"Connection failed:\n\n{str(e)}")
-                self.root.after(0, update_ui)
+            self.root.after(0, update_ui)
 
-        Thread(target=test_thread, daemon=True).start()
+        self.worker.submit(test_thread)
 
     def do_push_entire_site(self):
         """Push entire site: database + all WordPress content folders"""
-        from ..utils.logger import setup_logger
         logger = setup_logger('main_window')
 
         # Get selected site
@@ -1726,7 +2182,7 @@ class MainWindow:
             messagebox.showwarning("No Selection", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
 
         # Check if database is configured
         if not site.database_config:
@@ -1760,7 +2216,7 @@ class MainWindow:
         self.push_files_button.config(state=tk.DISABLED)
         self.db_push_button.config(state=tk.DISABLED)
         self.push_entire_site_button.config(state=tk.DISABLED)
-        self.push_status.config(text="Pushing entire site...")
+        self.push_status_var.set("Pushing entire site...")
 
         # Show progress dialog
         progress = ProgressDialog(self.root, "Push Entire Site", "Starting full site push...")
@@ -1777,7 +2233,7 @@ class MainWindow:
 
             try:
                 # Step 1: Push database
-                progress.update_message("Step 1/2: Pushing database...")
+                progress.post_message("Step 1/2: Pushing database...")
                 logger.info("Pushing database...")
                 db_success, db_message, db_stats = self.db_push_controller.push(site_id)
                 total_stats['db_success'] = db_success
@@ -1790,7 +2246,7 @@ class MainWindow:
                 logger.info(f"Database push completed: {db_message}")
 
                 # Step 2: Push content folders
-                progress.update_message("Step 2/2: Pushing WordPress content folders...")
+                progress.post_message("Step 2/2: Pushing WordPress content folders...")
                 logger.info("Pushing WordPress content folders...")
 
                 folders = ['wp-content/themes/', 'wp-content/plugins/', 'wp-content/uploads/']
@@ -1817,38 +2273,37 @@ class MainWindow:
                 self.push_entire_site_button.config(state=tk.NORMAL)
 
                 if total_stats['db_success'] and total_stats['folders_success']:
-                    self.push_status.config(text="✓ Entire site pushed successfully")
+                    self.push_status_var.set("✓ Entire site pushed successfully")
                     # Play system bell sound to get user's attention
                     self.root.bell()
-                    messagebox.showinfo("✅ SUCCESS - ENTIRE SITE PUSHED!",
-                                      f"🚀 ENTIRE SITE PUSHED SUCCESSFULLY!\n\n"
-                                      f"════════════════════════════════\n\n"
-                                      f"DATABASE:\n"
-                                      f"  • Tables Exported: {total_stats['db_stats'].get('tables_exported', 0)}\n"
-                                      f"  • URLs Replaced: {total_stats['db_stats'].get('urls_replaced', 0)}\n"
-                                      f"  • Backup Created: {total_stats['db_stats'].get('backup_created', 'None')}\n\n"
-                                      f"CONTENT FOLDERS:\n"
-                                      f"  • Folders Pushed: {total_stats['folders_stats'].get('folders_pushed', 0)}\n"
-                                      f"  • Files Transferred: {total_stats['folders_stats'].get('files_pushed', 0)}\n\n"
-                                      f"════════════════════════════════\n\n"
-                                      f"✅ Your entire site is now LIVE on production!\n"
-                                      f"🌐 All content has been deployed successfully.")
+                    self.show_toast("✅ SUCCESS - ENTIRE SITE PUSHED!",
+                                    f"🚀 ENTIRE SITE PUSHED SUCCESSFULLY!\n\n"
+                                    f"════════════════════════════════\n\n"
+                                    f"DATABASE:\n"
+                                    f"  • Tables Exported: {total_stats['db_stats'].get('tables_exported', 0)}\n"
+                                    f"  • URLs Replaced: {total_stats['db_stats'].get('urls_replaced', 0)}\n"
+                                    f"  • Backup Created: {total_stats['db_stats'].get('backup_created', 'None')}\n\n"
+                                    f"CONTENT FOLDERS:\n"
+                                    f"  • Folders Pushed: {total_stats['folders_stats'].get('folders_pushed', 0)}\n"
+                                    f"  • Files Transferred: {total_stats['folders_stats'].get('files_pushed', 0)}\n\n"
+                                    f"════════════════════════════════\n\n"
+                                    f"✅ Your entire site is now LIVE on production!\n"
+                                    f"🌐 All content has been deployed successfully.")
                 else:
-                    self.push_status.config(text="✗ Push failed")
+                    self.push_status_var.set("✗ Push failed")
                     error_msg = "Push entire site failed:\n\n"
                     if not total_stats['db_success']:
                         error_msg += f"Database: {total_stats['db_message']}\n"
                     if not total_stats['folders_success']:
                         error_msg += f"Folders: {total_stats['folders_message']}"
-                    messagebox.showerror("Error", error_msg)
+                    self.show_toast("Error", error_msg, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=push_entire_site_thread, daemon=True).start()
+        self.worker.submit(push_entire_site_thread)
 
     def do_pull_entire_site(self):
         """Pull entire site: database + all WordPress content folders"""
-        from ..utils.logger import setup_logger
         logger = setup_logger('main_window')
 
         # Get selected site
@@ -1857,7 +2312,7 @@ class MainWindow:
             messagebox.showwarning("No Selection", "Please select a site from the Configuration tab")
             return
 
-        site = self.config_service.get_site(site_id)
+        site = self._sites_by_id.get(site_id)
 
         # Check if database is configured
         if not site.database_config:
@@ -1891,7 +2346,7 @@ class MainWindow:
         self.pull_files_button.config(state=tk.DISABLED)
         self.db_pull_button.config(state=tk.DISABLED)
         self.pull_entire_site_button.config(state=tk.DISABLED)
-        self.pull_status.config(text="Pulling entire site...")
+        self.pull_status_var.set("Pulling entire site...")
 
         # Show progress dialog
         progress = ProgressDialog(self.root, "Pull Entire Site", "Starting full site pull...")
@@ -1908,7 +2363,7 @@ class MainWindow:
 
             try:
                 # Step 1: Pull database
-                progress.update_message("Step 1/2: Pulling database...")
+                progress.post_message("Step 1/2: Pulling database...")
                 logger.info("Pulling database...")
                 db_success, db_message, db_stats = self.db_pull_controller.pull(site_id)
                 total_stats['db_success'] = db_success
@@ -1921,7 +2376,7 @@ class MainWindow:
                 logger.info(f"Database pull completed: {db_message}")
 
                 # Step 2: Pull content folders
-                progress.update_message("Step 2/2: Pulling WordPress content folders...")
+                progress.post_message("Step 2/2: Pulling WordPress content folders...")
                 logger.info("Pulling WordPress content folders...")
 
                 folders = ['wp-content/themes/', 'wp-content/plugins/', 'wp-content/uploads/']
@@ -1948,34 +2403,34 @@ class MainWindow:
                 self.pull_entire_site_button.config(state=tk.NORMAL)
 
                 if total_stats['db_success'] and total_stats['folders_success']:
-                    self.pull_status.config(text="✓ Entire site pulled successfully")
+                    self.pull_status_var.set("✓ Entire site pulled successfully")
                     # Play system bell sound to get user's attention
                     self.root.bell()
-                    messagebox.showinfo("✅ SUCCESS - ENTIRE SITE PULLED!",
-                                      f"🚀 ENTIRE SITE PULLED SUCCESSFULLY!\n\n"
-                                      f"════════════════════════════════\n\n"
-                                      f"DATABASE:\n"
-                                      f"  • Tables Imported: {total_stats['db_stats'].get('tables_exported', 0)}\n"
-                                      f"  • URLs Replaced: {total_stats['db_stats'].get('urls_replaced', 0)}\n"
-                                      f"  • Backup Created: {total_stats['db_stats'].get('backup_created', 'None')}\n\n"
-                                      f"CONTENT FOLDERS:\n"
-                                      f"  • Folders Pulled: {total_stats['folders_stats'].get('folders_pulled', 0)}\n"
-                                      f"  • Files Transferred: {total_stats['folders_stats'].get('files_pulled', 0)}\n\n"
-                                      f"════════════════════════════════\n\n"
-                                      f"✅ Your local site now matches production!\n"
-                                      f"🔄 All content has been synchronized successfully.")
+                    self.show_toast("✅ SUCCESS - ENTIRE SITE PULLED!",
+                                    f"🚀 ENTIRE SITE PULLED SUCCESSFULLY!\n\n"
+                                    f"════════════════════════════════\n\n"
+                                    f"DATABASE:\n"
+                                    f"  • Tables Imported: {total_stats['db_stats'].get('tables_exported', 0)}\n"
+                                    f"  • URLs Replaced: {total_stats['db_stats'].get('urls_replaced', 0)}\n"
+                                    f"  • Backup Created: {total_stats['db_stats'].get('backup_created', 'None')}\n\n"
+                                    f"CONTENT FOLDERS:\n"
+                                    f"  • Folders Pulled: {total_stats['folders_stats'].get('folders_pulled', 0)}\n"
+                                    f"  • Files Transferred: {total_stats['folders_stats'].get('files_pulled', 0)}\n\n"
+                                    f"════════════════════════════════\n\n"
+                                    f"✅ Your local site now matches production!\n"
+                                    f"🔄 All content has been synchronized successfully.")
                 else:
-                    self.pull_status.config(text="✗ Pull failed")
+                    self.pull_status_var.set("✗ Pull failed")
                     error_msg = "Pull entire site failed:\n\n"
                     if not total_stats['db_success']:
                         error_msg += f"Database: {total_stats['db_message']}\n"
                     if not total_stats['folders_success']:
                         error_msg += f"Folders: {total_stats['folders_message']}"
-                    messagebox.showerror("Error", error_msg)
+                    self.show_toast("Error", error_msg, level='error')
 
             self.root.after(0, update_ui)
 
-        Thread(target=pull_entire_site_thread, daemon=True).start()
+        self.worker.submit(pull_entire_site_thread)
 
 
 def run_gui():
@@ -1983,3 +2438,4 @@ def run_gui():
     root = tk.Tk()
     app = MainWindow(root)
     root.mainloop()
+    app.sftp_pool.close_all()
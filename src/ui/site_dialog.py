@@ -17,6 +17,7 @@ class SiteDialog:
         self.config_service = config_service
         self.site = site
         self.result = None
+        self.saved_site = None
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Add Site" if site is None else "Edit Site")
@@ -40,15 +41,10 @@ class SiteDialog:
         # Setup click-through focus handling for macOS
         self._setup_focus_handling()
 
-        # Better focus handling for macOS
-        self.dialog.update_idletasks()
+        # Better focus handling for macOS (geometry was already flushed when centering)
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
-
-        # Force event processing
-        self.dialog.update()
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
 
         # Set focus to first field after a slight delay to ensure window is ready
@@ -166,9 +162,10 @@ class SiteDialog:
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
+        # Scroll region follows the frame's own size (no bbox walk over children)
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -216,7 +213,7 @@ class SiteDialog:
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -278,7 +275,7 @@ class SiteDialog:
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -350,7 +347,7 @@ class SiteDialog:
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -421,7 +418,7 @@ class SiteDialog:
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -492,7 +489,7 @@ class SiteDialog:
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -996,8 +993,7 @@ class SiteDialog:
         self.dialog.update_idletasks()
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
 
     def browse_git(self):
@@ -1022,8 +1018,7 @@ class SiteDialog:
         self.dialog.update_idletasks()
         self.dialog.lift()
         self.dialog.attributes('-topmost', True)
-        self.dialog.update()
-        self.dialog.attributes('-topmost', False)
+        self.dialog.after_idle(self.dialog.attributes, '-topmost', False)
         self.dialog.focus_force()
 
     def same_as_local(self):
@@ -1260,6 +1255,10 @@ class SiteDialog:
             compress_folders=compress_folders,
             database_config=database_config
         )
+        # Not editable in the dialog; keep the values from the config file
+        if self.site:
+            site_config.transfer_workers = self.site.transfer_workers
+            site_config.ssh_window_mb = self.site.ssh_window_mb
 
         # Save password to keyring
         password = self.password_entry.get()
@@ -1274,6 +1273,7 @@ class SiteDialog:
                 self.config_service.add_site(site_config, password)
 
             self.result = True
+            self.saved_site = site_config
             try:
                 self.dialog.grab_release()
             except:
@@ -0,0 +1,131 @@
+"""
+Compressor selection and tar pipelines for streamed folder transfers
+"""
+import shlex
+import shutil
+import subprocess
+from typing import List, Set
+
+# Multi-threaded compressors, preferred over tar's built-in single-threaded gzip
+PARALLEL_COMPRESSORS = ('zstd', 'pigz')
+
+# Compressor stage appended after `tar -cf -`; gzip is left to tar itself (tar -z)
+_COMPRESS = {
+    'zstd': ['zstd', '-T0', '-3', '-q', '-c'],
+    'pigz': ['pigz', '-c'],
+}
+_DECOMPRESS = {
+    'zstd': ['zstd', '-d', '-q', '-c'],
+    'pigz': ['pigz', '-d', '-c'],
+}
+
+
+def local_compressors() -> Set[str]:
+    """Return the parallel compressors installed on this machine"""
+    return {name for name in PARALLEL_COMPRESSORS if shutil.which(name)}
+
+
+def choose_compressor(sender: Set[str], receiver: Set[str]) -> str:
+    """
+    Pick the fastest compressor both ends of a transfer can handle
+
+    Args:
+        sender: Parallel compressors available where the tarball is created
+        receiver: Parallel compressors available where it is extracted
+
+    Returns:
+        'zstd', 'pigz' or 'gzip'
+    """
+    if 'zstd' in sender and 'zstd' in receiver:
+        return 'zstd'
+    # pigz writes plain gzip, so the receiving side doesn't need it
+    if 'pigz' in sender:
+        return 'pigz'
+    return 'gzip'
+
+
+def tar_create_commands(compressor: str, directory: str, paths: List[str]) -> List[List[str]]:
+    """
+    Build the pipeline writing a compressed tarball to stdout
+
+    Args:
+        compressor: Result of choose_compressor
+        directory: Directory the archived paths are relative to
+        paths: Paths to archive
+
+    Returns:
+        Commands to connect stdout to stdin in order
+    """
+    if compressor not in _COMPRESS:
+        return [['tar', '-C', directory, '-czf', '-'] + paths]
+    return [['tar', '-C', directory, '-cf', '-'] + paths, _COMPRESS[compressor]]
+
+
+def tar_extract_commands(compressor: str, directory: str, receiver: Set[str]) -> List[List[str]]:
+    """
+    Build the pipeline extracting a compressed tarball read from stdin
+
+    Args:
+        compressor: Compressor the tarball was created with
+        directory: Directory to extract into
+        receiver: Parallel compressors available on the extracting side
+
+    Returns:
+        Commands to connect stdout to stdin in order
+    """
+    if compressor in _DECOMPRESS and compressor in receiver:
+        return [_DECOMPRESS[compressor], ['tar', '-xf', '-', '-C', directory]]
+    return [['tar', '-xzf', '-', '-C', directory]]
+
+
+def shell_pipeline(commands: List[List[str]]) -> str:
+    """
+    Join pipeline commands into a shell command line for the remote
+
+    A pipeline's exit status is normally the last command's, which would hide a
+    failing tar in front of the compressor; multi-command pipelines therefore run
+    under bash -o pipefail, so any failing command fails the whole line.
+
+    Args:
+        commands: Commands in pipeline order
+
+    Returns:
+        Shell command line
+    """
+    pipeline = ' | '.join(' '.join(shlex.quote(arg) for arg in command) for command in commands)
+    if len(commands) > 1:
+        return f"bash -o pipefail -c {shlex.quote(pipeline)}"
+    return pipeline
+
+
+def start_pipeline(commands: List[List[str]], stdin=None, stdout=None, env=None) -> List[subprocess.Popen]:
+    """
+    Start local processes connected like a shell pipeline
+
+    Args:
+        commands: Commands in pipeline order
+        stdin: stdin of the first process (e.g. subprocess.PIPE)
+        stdout: stdout of the last process (e.g. subprocess.PIPE)
+        env: Optional environment for all processes
+
+    Returns:
+        Started processes in pipeline order
+    """
+    processes = []
+    for n, command in enumerate(commands):
+        last = n == len(commands) - 1
+        process = subprocess.Popen(command,
+                                   stdin=processes[-1].stdout if processes else stdin,
+                                   stdout=stdout if last else subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, env=env)
+        if processes:
+            # Only the next process reads this pipe; lets the writer see SIGPIPE
+            processes[-1].stdout.close()
+        processes.append(process)
+    return processes
+
+
+def wait_pipeline(processes: List[subprocess.Popen]) -> int:
+    """Wait for every process and return the first non-zero exit status (or 0)"""
+    statuses = [process.wait() for process in processes]
+    return next((status for status in statuses if status != 0), 0)
@@ -6,14 +6,23 @@ import os
 from pathlib import Path
 
 
-def setup_logger(name='wp-deploy'):
-    """Set up logger with file and console handlers"""
+def _file_handler():
+    """Create the handler that writes to the operations log file"""
     # Create logs directory
     log_dir = Path.home() / '.wp-deploy' / 'logs'
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_file = log_dir / 'operations.log'
 
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(logging.INFO)
+    file_format = logging.Formatter('%(asctime)s [%(levelname)s] [%(name)s] %(message)s')
+    file_handler.setFormatter(file_format)
+    return file_handler
+
+
+def setup_logger(name='wp-deploy'):
+    """Set up logger with file and console handlers"""
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
@@ -23,10 +32,7 @@ def setup_logger(name='wp-deploy'):
         return logger
 
     # File handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.INFO)
-    file_format = logging.Formatter('%(asctime)s [%(levelname)s] [%(name)s] %(message)s')
-    file_handler.setFormatter(file_format)
+    file_handler = _file_handler()
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -38,3 +44,18 @@ def setup_logger(name='wp-deploy'):
     logger.addHandler(console_handler)
 
     return logger
+
+
+def setup_file_logger(name):
+    """Set up logger that only writes to the log file, bypassing the UI log viewer"""
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    # Prevent duplicate handlers
+    if logger.handlers:
+        return logger
+
+    logger.addHandler(_file_handler())
+
+    return logger
@@ -0,0 +1,75 @@
+"""
+Tests for compressor selection and tar pipeline helpers
+"""
+import shutil
+import subprocess
+import unittest
+
+from src.utils.compression import (choose_compressor, shell_pipeline, tar_create_commands,
+                                   tar_extract_commands)
+
+
+class ChooseCompressorTest(unittest.TestCase):
+    """Picking the fastest compressor both ends support"""
+
+    def test_zstd_needs_both_ends(self):
+        self.assertEqual(choose_compressor({'zstd', 'pigz'}, {'zstd'}), 'zstd')
+        self.assertEqual(choose_compressor({'zstd'}, set()), 'gzip')
+
+    def test_pigz_only_needs_the_sender(self):
+        self.assertEqual(choose_compressor({'zstd', 'pigz'}, set()), 'pigz')
+        self.assertEqual(choose_compressor({'pigz'}, {'zstd'}), 'pigz')
+
+    def test_falls_back_to_gzip(self):
+        self.assertEqual(choose_compressor(set(), {'zstd', 'pigz'}), 'gzip')
+
+
+class TarCommandsTest(unittest.TestCase):
+    """Create/extract pipelines for each compressor"""
+
+    def test_gzip_is_left_to_tar(self):
+        self.assertEqual(tar_create_commands('gzip', '/site', ['wp-content/']),
+                         [['tar', '-C', '/site', '-czf', '-', 'wp-content/']])
+        self.assertEqual(tar_extract_commands('gzip', '/site', set()),
+                         [['tar', '-xzf', '-', '-C', '/site']])
+
+    def test_parallel_compressor_is_a_separate_stage(self):
+        self.assertEqual(tar_create_commands('zstd', '/site', ['a', 'b']),
+                         [['tar', '-C', '/site', '-cf', '-', 'a', 'b'], ['zstd', '-T0', '-3', '-q', '-c']])
+        self.assertEqual(tar_extract_commands('pigz', '/site', {'pigz'}),
+                         [['pigz', '-d', '-c'], ['tar', '-xf', '-', '-C', '/site']])
+
+    def test_pigz_output_extracts_with_plain_tar(self):
+        self.assertEqual(tar_extract_commands('pigz', '/site', set()),
+                         [['tar', '-xzf', '-', '-C', '/site']])
+
+
+class ShellPipelineTest(unittest.TestCase):
+    """Quoting and exit status of remote command lines"""
+
+    def run_shell(self, command):
+        return subprocess.run(['sh', '-c', command], capture_output=True, text=True)
+
+    def test_single_command_is_not_wrapped(self):
+        self.assertEqual(shell_pipeline([['tar', '-xzf', '-', '-C', '/site']]), 'tar -xzf - -C /site')
+
+    def test_arguments_are_quoted(self):
+        tricky = "it's a $HOME `test`; rm -rf /"
+        result = self.run_shell(shell_pipeline([['printf', '%s', tricky]]))
+        self.assertEqual(result.stdout, tricky)
+
+    @unittest.skipUnless(shutil.which('bash'), "bash not installed")
+    def test_multi_stage_arguments_are_quoted(self):
+        tricky = "/var/www/my site's \"root\""
+        result = self.run_shell(shell_pipeline([['printf', '%s', tricky], ['cat']]))
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, tricky)
+
+    @unittest.skipUnless(shutil.which('bash'), "bash not installed")
+    def test_failure_in_any_stage_fails_the_pipeline(self):
+        self.assertNotEqual(self.run_shell(shell_pipeline([['false'], ['cat']])).returncode, 0)
+        self.assertNotEqual(self.run_shell(shell_pipeline([['true'], ['false']])).returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
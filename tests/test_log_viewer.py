@@ -0,0 +1,60 @@
+"""
+Tests for log viewer line trimming
+"""
+import logging
+import tkinter as tk
+import unittest
+
+from src.ui.log_viewer import LogViewer, LogHandler, MAX_LINES, TRIM_SLACK
+
+
+class LogViewerTrimTest(unittest.TestCase):
+    """The viewer keeps the newest MAX_LINES lines, trimming in batches"""
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as e:
+            self.skipTest(f"no display: {e}")
+        self.root.withdraw()
+        self.viewer = LogViewer(self.root)
+
+    def tearDown(self):
+        root_logger = logging.getLogger()
+        for handler in [h for h in root_logger.handlers if isinstance(h, LogHandler)]:
+            root_logger.removeHandler(handler)
+        self.root.destroy()
+
+    def lines(self):
+        return self.viewer.text.get('1.0', 'end-1c').splitlines()
+
+    def test_no_trim_within_slack(self):
+        entries = [f"line {i}" for i in range(MAX_LINES + TRIM_SLACK)]
+        self.viewer.add_logs(entries)
+        self.assertEqual(self.lines(), entries)
+
+    def test_trims_back_to_max_lines(self):
+        entries = [f"line {i}" for i in range(MAX_LINES + TRIM_SLACK + 1)]
+        self.viewer.add_logs(entries)
+        self.assertEqual(self.lines(), entries[-MAX_LINES:])
+
+    def test_trims_across_batches(self):
+        entries = [f"line {i}" for i in range(3 * MAX_LINES)]
+        for start in range(0, len(entries), 37):
+            self.viewer.add_logs(entries[start:start + 37])
+
+        lines = self.lines()
+        self.assertLessEqual(len(lines), MAX_LINES + TRIM_SLACK)
+        self.assertGreaterEqual(len(lines), MAX_LINES)
+        self.assertEqual(lines, entries[-len(lines):])
+
+    def test_clear_resets_line_count(self):
+        self.viewer.add_logs([f"line {i}" for i in range(MAX_LINES)])
+        self.viewer.clear()
+        entries = [f"new {i}" for i in range(MAX_LINES + TRIM_SLACK)]
+        self.viewer.add_logs(entries)
+        self.assertEqual(self.lines(), entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Tests for the push fingerprint cache
+"""
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.services.push_cache import PushCache, file_digest
+
+
+def remote(mtime, size):
+    """Remote attributes as returned by an SFTP stat or a remote listing"""
+    return SimpleNamespace(st_mtime=mtime, st_size=size)
+
+
+class PushCacheTest(unittest.TestCase):
+    """Fingerprint hits, misses and persistence"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.cache_file = self.dir / 'cache' / 'site.json'
+        self.local_file = self.dir / 'style.css'
+        self.local_file.write_text('body {}')
+        self.remote = remote(1700000000.5, 7)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def recorded_cache(self):
+        cache = PushCache(self.cache_file)
+        cache.record('style.css', str(self.local_file), self.remote)
+        return cache
+
+    def test_unknown_file_is_changed(self):
+        cache = PushCache(self.cache_file)
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+    def test_recorded_file_is_unchanged(self):
+        cache = self.recorded_cache()
+        self.assertTrue(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+    def test_missing_remote_file_is_changed(self):
+        cache = self.recorded_cache()
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), None))
+
+    def test_nothing_recorded_without_remote_attributes(self):
+        cache = PushCache(self.cache_file)
+        cache.record('style.css', str(self.local_file), None)
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+    def test_remote_change_invalidates(self):
+        cache = self.recorded_cache()
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), remote(1700000100, 7)))
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), remote(1700000000, 8)))
+
+    def test_local_edit_invalidates(self):
+        cache = self.recorded_cache()
+        self.local_file.write_text('body { margin: 0 }')
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+    def test_same_size_edit_with_new_mtime_invalidates(self):
+        cache = self.recorded_cache()
+        st = os.stat(self.local_file)
+        self.local_file.write_text('div {}!')
+        os.utime(self.local_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+    def test_touched_file_with_same_content_is_unchanged(self):
+        cache = self.recorded_cache()
+        st = os.stat(self.local_file)
+        new_mtime_ns = st.st_mtime_ns + 10**9
+        os.utime(self.local_file, ns=(st.st_atime_ns, new_mtime_ns))
+
+        self.assertTrue(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+        # The new mtime is remembered, so the next check doesn't need the hash
+        cache.save()
+        entry = json.loads(self.cache_file.read_text())['style.css']
+        self.assertEqual(entry[0], new_mtime_ns)
+
+    def test_save_and_reload(self):
+        cache = self.recorded_cache()
+        cache.save()
+
+        self.assertTrue(self.cache_file.exists())
+        self.assertFalse(self.cache_file.with_suffix('.tmp').exists())
+
+        reloaded = PushCache(self.cache_file)
+        self.assertTrue(reloaded.is_unchanged('style.css', str(self.local_file), self.remote))
+        entry = json.loads(self.cache_file.read_text())['style.css']
+        self.assertEqual(entry[2], file_digest(str(self.local_file)))
+        self.assertEqual(entry[3:], [1700000000, 7])
+
+    def test_save_replaces_existing_file(self):
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text(json.dumps({'old.css': [0, 0, '', 0, 0]}))
+
+        cache = PushCache(self.cache_file)
+        cache.record('style.css', str(self.local_file), self.remote)
+        cache.save()
+
+        self.assertEqual(set(json.loads(self.cache_file.read_text())), {'old.css', 'style.css'})
+
+    def test_unreadable_cache_starts_empty(self):
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text('{not json')
+
+        cache = PushCache(self.cache_file)
+        self.assertFalse(cache.is_unchanged('style.css', str(self.local_file), self.remote))
+
+
+if __name__ == '__main__':
+    unittest.main()